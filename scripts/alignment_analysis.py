@@ -14,12 +14,8 @@ base_dir = Path(__file__).parent.parent
 sys.path.append(str(base_dir / "src"))
 
 from celestron_aux.celestron_indi_driver import CelestronAUXDriver, STEPS_PER_REVOLUTION
-from celestron_aux.celestron_aux_driver import (
-    AUXCommand,
-    AUXCommands,
-    AUXTargets,
-    unpack_int3_steps,
-)
+from celestron_aux.alignment import vector_from_altaz_batch
+from sim_truth import get_encoder_and_sky_altaz, get_sky_altaz
 
 
 class AlignmentAnalyzer:
@@ -39,6 +35,8 @@ class AlignmentAnalyzer:
         await self.driver.handle_connection(None)
         if not self.driver.communicator or not self.driver.communicator.connected:
             return False
+        # Only the simulator is on the wire; overlap request round-trips
+        self.driver.communicator.pipeline = True
         return True
 
     async def reset(self):
@@ -47,16 +45,7 @@ class AlignmentAnalyzer:
         self.driver.refraction_on.membervalue = "Off"
 
     async def get_truth(self):
-        resp_az = await self.driver.communicator.send_command(
-            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, AUXTargets.AZM)
-        )
-        true_az_deg = (unpack_int3_steps(resp_az.data) / 16777216.0) * 360.0
-        resp_alt = await self.driver.communicator.send_command(
-            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, AUXTargets.ALT)
-        )
-        true_alt_deg = (unpack_int3_steps(resp_alt.data) / 16777216.0) * 360.0
-        if true_alt_deg > 180:
-            true_alt_deg -= 360.0
+        true_az_deg, true_alt_deg = await get_sky_altaz(self.driver.communicator)
 
         ra_rad, dec_rad = self.driver.observer.radec_of(
             math.radians(true_az_deg), math.radians(true_alt_deg)
@@ -64,38 +53,21 @@ class AlignmentAnalyzer:
         return (ra_rad / (2 * math.pi)) * 24.0, (dec_rad / (2 * math.pi)) * 360.0
 
     async def perform_sync(self, ra, dec):
-        await self.driver.read_mount_position()
-        raw_az_deg = (self.driver.current_azm_steps / 16777216.0) * 360.0
-        raw_alt_deg = (self.driver.current_alt_steps / 16777216.0) * 360.0
-        if raw_alt_deg > 180:
-            raw_alt_deg -= 360.0
-
-        resp_az = await self.driver.communicator.send_command(
-            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, AUXTargets.AZM)
-        )
-        true_az_deg = (unpack_int3_steps(resp_az.data) / 16777216.0) * 360.0
-        resp_alt = await self.driver.communicator.send_command(
-            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, AUXTargets.ALT)
+        # Encoders and truth go out in one pipelined batch
+        (raw_az, raw_alt), (true_az, true_alt) = await get_encoder_and_sky_altaz(
+            self.driver.communicator
         )
-        true_alt_deg = (unpack_int3_steps(resp_alt.data) / 16777216.0) * 360.0
-        if true_alt_deg > 180:
-            true_alt_deg -= 360.0
 
-        from celestron_aux.alignment import vector_from_altaz
-
-        sky_vec = vector_from_altaz(true_az_deg, true_alt_deg)
-        mount_vec = vector_from_altaz(raw_az_deg, raw_alt_deg)
+        sky_vec, mount_vec = vector_from_altaz_batch(
+            [true_az, raw_az], [true_alt, raw_alt]
+        )
 
         self.driver._align_model.add_point(sky_vec, mount_vec)
         await self.driver.update_alignment_status()
 
     async def wait_for_idle(self):
-        for _ in range(40):
-            await self.driver.read_mount_position()
-            if self.driver.slewing_light.membervalue == "Idle":
-                return True
-            await asyncio.sleep(0.1)
-        return False
+        # Syncs and accuracy checks read the axes themselves, in one batch
+        return await self.driver.wait_for_slew_idle(4.0)
 
     async def check_accuracy(self, ra, dec):
         self.driver.ra.membervalue = ra % 24.0
@@ -106,11 +78,7 @@ class AlignmentAnalyzer:
         truth = await self.get_truth()
         true_ra, true_dec = truth
 
-        ra_diff = true_ra - (ra % 24.0)
-        if ra_diff > 12:
-            ra_diff -= 24
-        if ra_diff < -12:
-            ra_diff += 24
+        ra_diff = (true_ra - ra + 12.0) % 24.0 - 12.0
 
         ra_err = ra_diff * 3600.0 * 15.0 * math.cos(math.radians(dec))
         dec_err = (true_dec - dec) * 3600.0
@@ -129,16 +97,17 @@ class AlignmentAnalyzer:
         # Scenarios: 1, 2, 3, 6
         point_counts = [1, 2, 3, 6]
 
-        all_stars = []
-        for i in range(10):
-            # Spiral outward
-            r = 5.0 + i * 3.0
-            angle = i * 137.5
-            d_ra = (r * math.cos(math.radians(angle))) / (
-                15.0 * math.cos(math.radians(target_center_dec))
-            )
-            d_dec = r * math.sin(math.radians(angle))
-            all_stars.append((target_center_ra + d_ra, target_center_dec + d_dec))
+        # Golden-angle spiral outward from the target centre
+        k = np.arange(10)
+        r = 5.0 + 3.0 * k
+        angle = np.radians(137.5 * k)
+        d_ra = r * np.cos(angle) / (15.0 * math.cos(math.radians(target_center_dec)))
+        d_dec = r * np.sin(angle)
+        all_stars = np.column_stack(
+            (target_center_ra + d_ra, target_center_dec + d_dec)
+        ).tolist()
+        local_target = (target_center_ra + 0.5, target_center_dec + 2.0)
+        global_target = ((target_center_ra + 10) % 24.0, target_center_dec - 30)
 
         for count in point_counts:
             await self.reset()
@@ -151,25 +120,13 @@ class AlignmentAnalyzer:
                 await self.wait_for_idle()
                 await self.perform_sync(ra, dec)
 
-            # Measure local accuracy
-            local_errs = []
-            for i in range(1):
-                ra = target_center_ra + 0.5
-                dec = target_center_dec + 2.0
-                err = await self.check_accuracy(ra, dec)
-                local_errs.append(err)
-
-            # Measure global accuracy
-            global_errs = []
-            for i in range(1):
-                ra = (target_center_ra + 10) % 24.0
-                dec = target_center_dec - 30
-                err = await self.check_accuracy(ra, dec)
-                global_errs.append(err)
+            # Measure local and global accuracy
+            local_err = await self.check_accuracy(*local_target)
+            global_err = await self.check_accuracy(*global_target)
 
             rms = float(self.driver.align_rms_error.membervalue)
             print(
-                f'{count:<10} | {np.mean(local_errs):>10.1f}" | {np.mean(global_errs):>11.1f}" | {rms:>8.1f}"'
+                f'{count:<10} | {local_err:>10.1f}" | {global_err:>11.1f}" | {rms:>8.1f}"'
             )
 
 
@@ -1,6 +1,7 @@
 import asyncio
 import sys
 import os
+import socket
 import termios
 import tty
 import argparse
@@ -10,6 +11,16 @@ from datetime import datetime
 # Simple INDI XML templates
 GET_PROPS = '<getProperties version="1.7" />\n'
 
+# Vector type of each property the test writes
+PROP_KINDS = {
+    "CONNECTION": "Switch",
+    "TELESCOPE_ABORT_MOTION": "Switch",
+    "TELESCOPE_MOTION_NS": "Switch",
+    "TELESCOPE_MOTION_WE": "Switch",
+    "SLEW_RATE": "Number",
+    "TELESCOPE_ABSOLUTE_COORD": "Number",
+}
+
 
 def deep_merge(base: dict, override: dict) -> dict:
     """Recursively merges two dictionaries."""
@@ -66,6 +77,21 @@ class HITValidation:
         self.reader = None
         self.writer = None
         self.abort_event = asyncio.Event()
+        self._abort_task = None
+        self._keys = asyncio.Queue()
+        self._tty_settings = None
+        # Per-property (opening tag, member format, closing tag), built once
+        self._prop_templates = {
+            name: (
+                f'<new{kind}Vector device="{device}" name="{name}">\n',
+                f'  <one{kind} name="{{}}">{{}}</one{kind}>\n',
+                f"</new{kind}Vector>\n",
+            )
+            for name, kind in PROP_KINDS.items()
+        }
+        # The emergency stop is sent ready-made, with nothing to format
+        abort_xml = self._prop_xml("TELESCOPE_ABORT_MOTION", {"ABORT": "On"})
+        self._abort_msg = abort_xml.encode()
 
     async def connect(self):
         print(f"Connecting to INDI server at {self.host}:{self.port}...")
@@ -73,6 +99,11 @@ class HITValidation:
             self.reader, self.writer = await asyncio.open_connection(
                 self.host, self.port
             )
+            # asyncio already disables Nagle on TCP sockets; keep-alive lets a
+            # dead server surface as an error rather than a silent stall.
+            sock = self.writer.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             if self.writer:
                 self.writer.write(GET_PROPS.encode())
                 await self.writer.drain()
@@ -81,63 +112,61 @@ class HITValidation:
             print(f"Connection failed: {e}")
             return False
 
+    def _prop_xml(self, property_name, members):
+        """Builds the newXXXVector message for a property, or None if unknown."""
+        tpl = self._prop_templates.get(property_name)
+        if tpl is None:
+            print(f"Unknown property: {property_name}")
+            return None
+        head, item, tail = tpl
+        return head + "".join(item.format(k, v) for k, v in members.items()) + tail
+
     async def send_prop(self, property_name, members):
         """Sends a newProperty or switch command."""
-        if not self.writer:
-            return
+        await self.send_props_batch([(property_name, members)])
 
-        if property_name == "CONNECTION":
-            xml = f'<newSwitchVector device="{self.device}" name="CONNECTION">\n'
-            for k, v in members.items():
-                xml += f'  <oneSwitch name="{k}">{v}</oneSwitch>\n'
-            xml += "</newSwitchVector>\n"
-        elif property_name == "TELESCOPE_ABORT_MOTION":
-            xml = f'<newSwitchVector device="{self.device}" name="TELESCOPE_ABORT_MOTION">\n'
-            xml += f'  <oneSwitch name="ABORT">On</oneSwitch>\n'
-            xml += "</newSwitchVector>\n"
-        elif property_name == "TELESCOPE_MOTION_NS":
-            xml = (
-                f'<newSwitchVector device="{self.device}" name="TELESCOPE_MOTION_NS">\n'
-            )
-            for k, v in members.items():
-                xml += f'  <oneSwitch name="{k}">{v}</oneSwitch>\n'
-            xml += "</newSwitchVector>\n"
-        elif property_name == "TELESCOPE_MOTION_WE":
-            xml = (
-                f'<newSwitchVector device="{self.device}" name="TELESCOPE_MOTION_WE">\n'
-            )
-            for k, v in members.items():
-                xml += f'  <oneSwitch name="{k}">{v}</oneSwitch>\n'
-            xml += "</newSwitchVector>\n"
-        elif property_name == "SLEW_RATE":
-            xml = f'<newNumberVector device="{self.device}" name="SLEW_RATE">\n'
-            xml += f'  <oneNumber name="RATE">{members["RATE"]}</oneNumber>\n'
-            xml += "</newNumberVector>\n"
-        elif property_name == "TELESCOPE_ABSOLUTE_COORD":
-            xml = f'<newNumberVector device="{self.device}" name="TELESCOPE_ABSOLUTE_COORD">\n'
-            xml += f'  <oneNumber name="AZM_STEPS">{members["AZM_STEPS"]}</oneNumber>\n'
-            xml += f'  <oneNumber name="ALT_STEPS">{members["ALT_STEPS"]}</oneNumber>\n'
-            xml += "</newNumberVector>\n"
-        else:
-            print(f"Unknown property: {property_name}")
+    async def send_props_batch(self, ops):
+        """Sends several (property_name, members) updates in one write/drain."""
+        if not self.writer:
             return
-
-        self.writer.write(xml.encode())
-        await self.writer.drain()
+        xml = "".join(filter(None, (self._prop_xml(n, m) for n, m in ops)))
+        if xml:
+            self.writer.write(xml.encode())
+            await self.writer.drain()
 
     async def abort(self):
         print("\n!!! EMERGENCY STOP TRIGGERED !!!")
-        await self.send_prop("TELESCOPE_ABORT_MOTION", {"ABORT": "On"})
+        if self.writer:
+            self.writer.write(self._abort_msg)
+            await self.writer.drain()
         self.abort_event.set()
 
-    async def monitor_abort(self):
-        """Background task to watch for Space key."""
-        while not self.abort_event.is_set():
-            loop = asyncio.get_event_loop()
-            key = await loop.run_in_executor(None, self._get_char_raw)
-            if key == " " or key == "\x03":  # Space or Ctrl+C
-                await self.abort()
-                break
+    def _start_keyboard(self):
+        """Puts the terminal in cbreak mode and watches stdin on the event loop."""
+        fd = sys.stdin.fileno()
+        self._tty_settings = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        # Deliver Ctrl+C as a key so it triggers the abort like Space
+        mode = termios.tcgetattr(fd)
+        mode[3] &= ~termios.ISIG
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+        asyncio.get_running_loop().add_reader(fd, self._on_stdin, fd)
+
+    def _stop_keyboard(self):
+        """Stops watching stdin and restores the terminal."""
+        if self._tty_settings is None:
+            return
+        fd = sys.stdin.fileno()
+        asyncio.get_running_loop().remove_reader(fd)
+        termios.tcsetattr(fd, termios.TCSADRAIN, self._tty_settings)
+        self._tty_settings = None
+
+    def _on_stdin(self, fd):
+        """Reader callback: Space/Ctrl+C abort at once, every key is queued."""
+        ch = os.read(fd, 1).decode(errors="ignore")
+        if ch in (" ", "\x03") and self._abort_task is None:
+            self._abort_task = asyncio.ensure_future(self.abort())
+        self._keys.put_nowait(ch)
 
     async def confirm(self, message):
         """Waits for user Enter to proceed or Space to abort."""
@@ -145,25 +174,12 @@ class HITValidation:
         print("Press [Enter] to proceed, [Space] to ABORT and EXIT.")
 
         while True:
-            loop = asyncio.get_event_loop()
-            ch = await loop.run_in_executor(None, self._get_char_raw)
-
+            ch = await self._keys.get()
             if ch in ("\r", "\n"):
                 return True
-            if ch == " ":
-                await self.abort()
+            if ch in (" ", "\x03"):
                 return False
 
-    def _get_char_raw(self):
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            ch = sys.stdin.read(1)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return ch
-
     async def run_test(self):
         if not await self.connect():
             return
@@ -171,7 +187,7 @@ class HITValidation:
         print("\n--- Hardware Interaction Test (HIT) ---")
         print("Safety: Press SPACE at any time to STOP all motion.")
 
-        abort_task = asyncio.create_task(self.monitor_abort())
+        self._start_keyboard()
 
         try:
             # 1. Initialization
@@ -184,9 +200,11 @@ class HITValidation:
             slew_rate = self.config.get("slew_rate", 2)
             # 2. Pulse Test N
             print(f"\nPhase 2: Directional Pulse (North) at Rate {slew_rate}")
-            await self.send_prop("SLEW_RATE", {"RATE": slew_rate})
-            await self.send_prop(
-                "TELESCOPE_MOTION_NS", {"SLEW_NORTH": "On", "SLEW_SOUTH": "Off"}
+            await self.send_props_batch(
+                [
+                    ("SLEW_RATE", {"RATE": slew_rate}),
+                    ("TELESCOPE_MOTION_NS", {"SLEW_NORTH": "On", "SLEW_SOUTH": "Off"}),
+                ]
             )
             await asyncio.sleep(2)
             await self.send_prop(
@@ -212,9 +230,11 @@ class HITValidation:
             print(f"\nPhase 4: Slew Speed Audit (Rate {fast_slew_rate})")
             if not await self.confirm("Ready for fast movement? Check cables!"):
                 return
-            await self.send_prop("SLEW_RATE", {"RATE": fast_slew_rate})
-            await self.send_prop(
-                "TELESCOPE_MOTION_WE", {"SLEW_WEST": "Off", "SLEW_EAST": "On"}
+            await self.send_props_batch(
+                [
+                    ("SLEW_RATE", {"RATE": fast_slew_rate}),
+                    ("TELESCOPE_MOTION_WE", {"SLEW_WEST": "Off", "SLEW_EAST": "On"}),
+                ]
             )
             await asyncio.sleep(1)
             await self.send_prop(
@@ -238,9 +258,12 @@ class HITValidation:
 
         except Exception as e:
             print(f"\nTest Error: {e}")
-            await self.abort()
+            if self._abort_task is None:
+                await self.abort()
         finally:
-            abort_task.cancel()
+            self._stop_keyboard()
+            if self._abort_task is not None:
+                await self._abort_task
             if self.writer:
                 self.writer.close()
                 await self.writer.wait_closed()
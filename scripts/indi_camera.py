@@ -0,0 +1,145 @@
+"""
+INDI camera client shared by the camera validation scripts.
+"""
+
+import asyncio
+import os
+import time
+from xml.parsers import expat
+
+# Simple INDI XML templates
+GET_PROPS = '<getProperties version="1.7" />\n'
+
+
+class CameraClient:
+    """
+    INDI client connection that drives one camera.
+
+    Keeps the server stream drained and turns the camera's exposure and
+    upload-settings replies into awaitable results. Subclasses add their
+    own mount commands through `send_xml`.
+    """
+
+    def __init__(self, host="localhost", port=7624, camera="CCD Simulator"):
+        self.host = host
+        self.port = port
+        self.camera = camera
+        self.reader = None
+        self.writer = None
+        self.upload_dir = "."
+        self._pump_task = None
+        self._exposure_done = None
+        self._upload_done = None
+
+    async def connect(self):
+        print(f"Connecting to INDI server at {self.host}:{self.port}...")
+        try:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+            self.writer.write(GET_PROPS.encode())
+            await self.writer.drain()
+            self._pump_task = asyncio.create_task(self._pump())
+            return True
+        except Exception as e:
+            print(f"Connection failed: {e}")
+            return False
+
+    async def close(self):
+        if self.writer:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+    async def _pump(self):
+        """Consumes the INDI stream so the server never stalls on this client."""
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = self._on_element
+        # INDI messages have no common root; give the parser one
+        parser.Parse(b"<indi>", False)
+        while chunk := await self.reader.read(4096):
+            try:
+                parser.Parse(chunk, False)
+            except expat.ExpatError as e:
+                print(f"INDI stream parse error: {e}")
+                return
+
+    def _on_element(self, name, attrs):
+        # The camera answers each request with Ok, or Alert on failure
+        state = attrs.get("state")
+        if attrs.get("device") != self.camera or state not in ("Ok", "Alert"):
+            return
+        if name == "setNumberVector" and attrs.get("name") == "CCD_EXPOSURE":
+            done = self._exposure_done
+        elif name == "setTextVector" and attrs.get("name") == "UPLOAD_SETTINGS":
+            done = self._upload_done
+        else:
+            return
+        if done is not None and not done.done():
+            done.set_result(state == "Ok")
+
+    async def send_xml(self, xml):
+        if self.writer:
+            self.writer.write(xml.encode())
+            await self.writer.drain()
+
+    async def set_upload(self, upload_prefix):
+        """Points the camera's uploads at `upload_dir`, once per run."""
+        xml_path = f'''<newTextVector device="{self.camera}" name="UPLOAD_SETTINGS">
+            <oneText name="UPLOAD_DIR">{os.path.abspath(self.upload_dir)}</oneText>
+            <oneText name="UPLOAD_PREFIX">{upload_prefix}</oneText>
+        </newTextVector>\n'''
+        self._upload_done = asyncio.get_running_loop().create_future()
+        await self.send_xml(xml_path)
+        # Proceed once the camera confirms; some drivers never echo the change
+        try:
+            await asyncio.wait_for(self._upload_done, 2.0)
+        except asyncio.TimeoutError:
+            pass
+
+    async def expose(self, exposure, upload_prefix):
+        """Takes one exposure and returns the uploaded FITS path, or None."""
+        xml_exp = f'''<newNumberVector device="{self.camera}" name="CCD_EXPOSURE">
+            <oneNumber name="EXPOSURE">{exposure}</oneNumber>
+        </newNumberVector>\n'''
+
+        started = time.time()
+        self._exposure_done = asyncio.get_running_loop().create_future()
+        await self.send_xml(xml_exp)
+
+        # Wait for the camera to report the exposure done, then for the upload
+        try:
+            if not await asyncio.wait_for(self._exposure_done, exposure + 15):
+                print("  Exposure failed")
+                return None
+        except asyncio.TimeoutError:
+            print("  No exposure completion seen; checking for the upload anyway")
+        return await self.wait_for_fits(upload_prefix, started)
+
+    async def wait_for_fits(self, prefix, since, timeout=30.0, poll=0.2):
+        """
+        Polls `upload_dir` for a FITS upload written after `since` and
+        returns its path. Frames already claimed as *.solve.fits are skipped.
+
+        A file is only returned once its size is unchanged between two polls,
+        so the solver never reads a partial upload.
+        """
+        deadline = time.time() + timeout
+        last = None
+        while time.time() < deadline:
+            with os.scandir(self.upload_dir) as entries:
+                latest = max(
+                    (
+                        (e.path, e.stat().st_size)
+                        for e in entries
+                        if e.name.startswith(prefix)
+                        and e.name.endswith(".fits")
+                        and not e.name.endswith(".solve.fits")
+                        and e.stat().st_mtime >= since
+                    ),
+                    default=None,
+                )
+            if latest and latest[1] and latest == last:
+                return latest[0]
+            last = latest
+            await asyncio.sleep(poll)
+        return None
@@ -14,17 +14,18 @@ import sys
 import asyncio
 import math
 import os
-import subprocess
+import shutil
+import tempfile
 import time
-import re
 import argparse
 import tomllib
 import numpy as np
+from scipy.signal import lombscargle
 from datetime import datetime
 from pathlib import Path
 
-# Simple INDI XML templates
-GET_PROPS = '<getProperties version="1.7" />\n'
+from indi_camera import CameraClient
+from plate_solve import parse_solution, parse_wcs, wcs_path
 
 
 def deep_merge(base: dict, override: dict) -> dict:
@@ -66,7 +67,44 @@ def load_config(config_path=None):
     return config
 
 
-class PECMeasurement:
+def dominant_period(ts, values, min_period=60.0, n_freq=2048):
+    """
+    Finds the strongest period in an irregularly sampled series.
+
+    Uses a Lomb-Scargle periodogram, which needs no resampling when captures
+    fail or drift off the nominal interval.
+
+    Args:
+        ts (np.ndarray): Sample times in seconds.
+        values (np.ndarray): Detrended samples.
+        min_period (float): Shortest period searched, in seconds.
+        n_freq (int): Number of trial frequencies.
+
+    Returns:
+        Optional[float]: Period in seconds, or None if the series is too short.
+    """
+    span = ts[-1] - ts[0]
+    if len(ts) < 4 or span <= min_period:
+        return None
+    freqs = np.linspace(1.0 / span, 1.0 / min_period, n_freq)
+    power = lombscargle(ts, values, 2.0 * np.pi * freqs, normalize=True)
+    return 1.0 / freqs[np.argmax(power)]
+
+
+def frame_dir():
+    """
+    Creates a scratch directory for camera frames, on tmpfs when available.
+
+    Frames are written, solved once and deleted, so keeping them in RAM spares
+    SD-card backed systems a flash write per frame.
+    """
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return tempfile.mkdtemp(prefix="pec_", dir=shm)
+    return tempfile.mkdtemp(prefix="pec_")
+
+
+class PECMeasurement(CameraClient):
     def __init__(
         self,
         host="localhost",
@@ -75,96 +113,64 @@ class PECMeasurement:
         camera="CCD Simulator",
         config=None,
     ):
-        self.host = host
-        self.port = port
+        super().__init__(host, port, camera)
         self.mount = mount
-        self.camera = camera
         self.config = config or {}
-        self.reader = None
-        self.writer = None
         self.data = []  # List of (timestamp, ra, dec)
+        self._captures = 0
+
+    async def capture(self, exposure, upload_prefix):
+        """Captures one image and returns its path, or None."""
+        frame = await self.expose(exposure, upload_prefix)
+        if frame is None:
+            return None
+        # Claim the frame so the next exposure cannot overwrite it mid-solve
+        self._captures += 1
+        filepath = os.path.join(
+            self.upload_dir, f"{upload_prefix}_{self._captures:04d}.solve.fits"
+        )
+        os.replace(frame, filepath)
+        return filepath
 
-    async def connect(self):
-        print(f"Connecting to INDI server at {self.host}:{self.port}...")
-        try:
-            self.reader, self.writer = await asyncio.open_connection(
-                self.host, self.port
-            )
-            self.writer.write(GET_PROPS.encode())
-            await self.writer.drain()
-            return True
-        except Exception as e:
-            print(f"Connection failed: {e}")
-            return False
-
-    async def send_xml(self, xml):
-        if self.writer:
-            self.writer.write(xml.encode())
-            await self.writer.drain()
-
-    async def capture_and_solve(self, exposure, upload_prefix):
-        """Captures one image and returns solved (ra, dec)."""
-        # 1. Set local path
-        xml_path = f'''<newTextVector device="{self.camera}" name="UPLOAD_SETTINGS">
-            <oneText name="UPLOAD_DIR">{os.getcwd()}</oneText>
-            <oneText name="UPLOAD_PREFIX">{upload_prefix}</oneText>
-        </newTextVector>\n'''
-        # 2. Trigger exposure
-        xml_exp = f'''<newNumberVector device="{self.camera}" name="CCD_EXPOSURE">
-            <oneNumber name="EXPOSURE">{exposure}</oneNumber>
-        </newNumberVector>\n'''
-
-        await self.send_xml(xml_path)
-        await asyncio.sleep(0.2)
-        await self.send_xml(xml_exp)
-
-        # Wait for capture (exposure + overhead)
-        await asyncio.sleep(exposure + 5)
-
-        # Find latest fits
-        files = [
-            f
-            for f in os.listdir(".")
-            if f.startswith(upload_prefix) and f.endswith(".fits")
-        ]
-        if not files:
-            return None, None
-        filepath = sorted(files)[-1]
-
-        # Solve with ASTAP
+    async def solve(self, filepath):
+        """Solves an image with ASTAP without blocking the event loop."""
         try:
-            res = subprocess.run(
-                ["astap", "-f", filepath, "-solve"], capture_output=True, text=True
+            proc = await asyncio.create_subprocess_exec(
+                "astap",
+                "-f",
+                filepath,
+                "-solve",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            if "Solution found" in res.stdout:
-                # Solution found: 18:36:56.2, +38:47:01
-                match = re.search(r"Solution found: ([\d:]+), ([\d\-:]+)", res.stdout)
-                if match:
-                    ra_str, dec_str = match.groups()
-                    ra = self.hms_to_float(ra_str)
-                    dec = self.dms_to_float(dec_str)
-                    # Clean up file
-                    os.remove(filepath)
-                    if os.path.exists(filepath.replace(".fits", ".wcs")):
-                        os.remove(filepath.replace(".fits", ".wcs"))
-                    return ra, dec
-            print(f"  Solve failed for {filepath}")
+            out = (await proc.communicate())[0].decode(errors="replace")
+            # Prefer the full-precision header over the rounded stdout text
+            wcs = wcs_path(filepath)
+            solution = parse_wcs(wcs) or parse_solution(out)
+            if solution:
+                # Clean up file
+                os.remove(filepath)
+                try:
+                    os.remove(wcs)
+                except FileNotFoundError:
+                    pass
+                return solution
+            # Keep the frame for inspection; the scratch directory is removed
+            kept = shutil.move(filepath, os.path.basename(filepath))
+            print(f"  Solve failed, frame kept as {kept}")
             return None, None
         except Exception as e:
             print(f"  ASTAP error: {e}")
             return None, None
 
-    def hms_to_float(self, hms):
-        h, m, s = map(float, hms.split(":"))
-        return h + m / 60.0 + s / 3600.0
-
-    def dms_to_float(self, dms):
-        parts = dms.split(":")
-        d = float(parts[0])
-        m = float(parts[1]) if len(parts) > 1 else 0
-        s = float(parts[2]) if len(parts) > 2 else 0
-        sign = 1 if d >= 0 else -1
-        return d + sign * (m / 60.0 + s / 3600.0)
+    async def solve_worker(self, queue):
+        """Solves queued (t_rel, filepath) captures in order until None."""
+        while (item := await queue.get()) is not None:
+            t_rel, filepath = item
+            ra, dec = await self.solve(filepath)
+            if ra is not None:
+                print(f"  [{t_rel:6.1f}s] Solved: RA={ra:.6f}h, Dec={dec:.6f}deg")
+                self.data.append((t_rel, ra, dec))
 
     async def run(self, duration_min=20, interval_sec=20, exposure=1.0):
         if not await self.connect():
@@ -182,25 +188,39 @@ class PECMeasurement:
         start_time = time.time()
         end_time = start_time + (duration_min * 60)
         upload_prefix = f"pec_meas_{datetime.now().strftime('%H%M%S')}"
-
+        self.upload_dir = frame_dir()
         try:
-            while time.time() < end_time:
-                now = time.time()
-                t_rel = now - start_time
-                print(f"[{t_rel:6.1f}s] Capturing...", end="", flush=True)
-
-                ra, dec = await self.capture_and_solve(exposure, upload_prefix)
-                if ra is not None:
-                    print(f" Solved: RA={ra:.6f}h, Dec={dec:.6f}deg")
-                    self.data.append((t_rel, ra, dec))
-
-                # Wait for next interval
-                elapsed = time.time() - now
-                wait = max(0.1, interval_sec - elapsed)
-                await asyncio.sleep(wait)
-
-        except KeyboardInterrupt:
-            print("\nAborted by user.")
+            await self.set_upload(upload_prefix)
+
+            # Solving runs alongside the next exposure so it cannot stretch the cadence
+            solve_queue = asyncio.Queue()
+            solver = asyncio.create_task(self.solve_worker(solve_queue))
+
+            next_frame = time.monotonic()
+            try:
+                while time.time() < end_time:
+                    now = time.time()
+                    t_rel = now - start_time
+                    print(f"[{t_rel:6.1f}s] Capturing...")
+
+                    filepath = await self.capture(exposure, upload_prefix)
+                    if filepath:
+                        solve_queue.put_nowait((t_rel, filepath))
+                    else:
+                        print("  No image found")
+
+                    # Hold a fixed cadence; after an overrun start again at once
+                    next_frame = max(next_frame + interval_sec, time.monotonic())
+                    await asyncio.sleep(next_frame - time.monotonic())
+
+            except KeyboardInterrupt:
+                print("\nAborted by user.")
+
+            # Let the solver finish the captured backlog
+            solve_queue.put_nowait(None)
+            await solver
+        finally:
+            shutil.rmtree(self.upload_dir, ignore_errors=True)
 
         # Save results
         if self.data:
@@ -218,25 +238,27 @@ class PECMeasurement:
         print(f"\nMeasurement complete. Data saved to {filename}")
 
         # Simple analysis
-        ts = np.array([d[0] for d in self.data])
-        ras = np.array([d[1] for d in self.data]) * 15.0 * 3600.0  # to arcsec
-        decs = np.array([d[2] for d in self.data]) * 3600.0  # to arcsec
-
-        # Remove linear trend (drift)
-        ra_p = np.polyfit(ts, ras, 1)
-        ra_detrend = ras - np.polyval(ra_p, ts)
+        data = np.array(self.data)
+        ts = data[:, 0]
+        pos = data[:, 1:] * (15.0 * 3600.0, 3600.0)  # RA, Dec in arcsec
 
-        dec_p = np.polyfit(ts, decs, 1)
-        dec_detrend = decs - np.polyval(dec_p, ts)
+        # Remove linear trend (drift) from both axes with one least-squares fit
+        design = np.column_stack((ts, np.ones_like(ts)))
+        coef, *_ = np.linalg.lstsq(design, pos, rcond=None)
+        ra_detrend = pos[:, 0] - design @ coef[:, 0]
+        ra_p, dec_p = coef.T
 
         pe_pp = np.max(ra_detrend) - np.min(ra_detrend)
         rms = np.sqrt(np.mean(ra_detrend**2))
+        period = dominant_period(ts, ra_detrend)
 
         print(f"--- Analysis ---")
         print(f"Total points: {len(self.data)}")
         print(f'RA Drift Rate: {ra_p[0]:.3f} "/s')
         print(f'RA Periodic Error (Peak-to-Peak): {pe_pp:.2f} "')
         print(f'RA Residual RMS: {rms:.2f} "')
+        if period is not None:
+            print(f"RA Dominant Period: {period:.1f} s")
         print(f'Dec Drift Rate: {dec_p[0]:.3f} "/s')
 
 
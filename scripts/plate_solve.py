@@ -0,0 +1,57 @@
+"""
+ASTAP output parsing shared by the camera validation scripts.
+"""
+
+import os
+import re
+
+# Solution found: 18:36:56.2, +38:47:01
+SOLUTION_RE = re.compile(r"Solution found:\s*([\d:.]+),\s*([+\-]?[\d:.]+)")
+# CRVAL1  =       279.2347380000 / RA of reference pixel
+_CRVAL_RE = re.compile(r"CRVAL([12])\s*=\s*([-+]?[\d.]+(?:[Ee][-+]?\d+)?)")
+_HMS_RE = re.compile(r"(\d+):(\d+):(\d+(?:\.\d*)?)$")
+_DMS_RE = re.compile(r"([+\-]?)(\d+)(?::(\d+))?(?::(\d+(?:\.\d*)?))?$")
+
+
+def hms_to_float(hms):
+    h, m, s = _HMS_RE.match(hms).groups()
+    return int(h) + int(m) / 60.0 + float(s) / 3600.0
+
+
+def dms_to_float(dms):
+    # The sign is taken from the text, so "-00:30:00" stays negative
+    sign, d, m, s = _DMS_RE.match(dms).groups()
+    value = int(d) + int(m or 0) / 60.0 + float(s or 0) / 3600.0
+    return -value if sign == "-" else value
+
+
+def parse_solution(output):
+    """Returns (ra_hours, dec_deg) from ASTAP's stdout, or None if unsolved."""
+    match = SOLUTION_RE.search(output)
+    if not match:
+        return None
+    ra_str, dec_str = match.groups()
+    return hms_to_float(ra_str), dms_to_float(dec_str)
+
+
+def wcs_path(fits_path):
+    """Returns the path of the .wcs sidecar ASTAP writes next to a solved image."""
+    return os.path.splitext(fits_path)[0] + ".wcs"
+
+
+def parse_wcs(path):
+    """
+    Returns (ra_hours, dec_deg) from an ASTAP .wcs header, or None.
+
+    CRVAL1/CRVAL2 carry the full-precision solution in degrees, unlike the
+    rounded sexagesimal text printed on stdout.
+    """
+    try:
+        with open(path, errors="replace") as f:
+            header = f.read(8192)
+    except FileNotFoundError:
+        return None
+    crval = dict(_CRVAL_RE.findall(header))
+    if "1" not in crval or "2" not in crval:
+        return None
+    return float(crval["1"]) / 15.0, float(crval["2"])
@@ -1,14 +1,15 @@
 import asyncio
 import sys
 import os
-import subprocess
-import time
 import math
 import argparse
-import re
 import tomllib
+import numpy as np
 from datetime import datetime
 
+from indi_camera import CameraClient
+from plate_solve import parse_solution, parse_wcs, wcs_path
+
 
 def deep_merge(base: dict, override: dict) -> dict:
     """Recursively merges two dictionaries."""
@@ -49,7 +50,7 @@ def load_config(config_path=None):
     return config
 
 
-class PPTAccuracy:
+class PPTAccuracy(CameraClient):
     """
     Photography & Pointing Test (PPT) for Celestron AUX Mount.
     Automates accuracy measurement using INDI and ASTAP.
@@ -63,34 +64,12 @@ class PPTAccuracy:
         camera_device="CCD Simulator",
         config=None,
     ):
-        self.host = host
-        self.port = port
+        super().__init__(host, port, camera_device)
         self.mount_device = mount_device
-        self.camera_device = camera_device
         self.config = config or {}
-        self.reader = None
-        self.writer = None
+        self.upload_prefix = self.config.get("upload_prefix", "ppt_capture")
         self.results = []  # List of (target_ra, target_dec, solved_ra, solved_dec, error)
 
-    async def connect(self):
-        print(f"Connecting to INDI at {self.host}:{self.port}...")
-        try:
-            self.reader, self.writer = await asyncio.open_connection(
-                self.host, self.port
-            )
-            if self.writer:
-                self.writer.write(b'<getProperties version="1.7" />\n')
-                await self.writer.drain()
-            return True
-        except Exception as e:
-            print(f"Connection failed: {e}")
-            return False
-
-    async def send_xml(self, xml):
-        if self.writer:
-            self.writer.write(xml.encode())
-            await self.writer.drain()
-
     async def slew_to(self, ra, dec):
         print(f"Slewing to RA {ra:.2f}, Dec {dec:.2f}...")
         xml = f'''<newNumberVector device="{self.mount_device}" name="EQUATORIAL_EOD_COORD">
@@ -103,69 +82,39 @@ class PPTAccuracy:
 
     async def capture_image(self, exposure=2.0):
         print(f"Capturing {exposure}s exposure...")
-        upload_prefix = self.config.get("upload_prefix", "ppt_capture")
-        # 1. Set local path
-        xml_path = f'''<newTextVector device="{self.camera_device}" name="UPLOAD_SETTINGS">
-            <oneText name="UPLOAD_DIR">{os.getcwd()}</oneText>
-            <oneText name="UPLOAD_PREFIX">{upload_prefix}</oneText>
-        </newTextVector>\n'''
-        # 2. Trigger exposure
-        xml_exp = f'''<newNumberVector device="{self.camera_device}" name="CCD_EXPOSURE">
-            <oneNumber name="EXPOSURE">{exposure}</oneNumber>
-        </newNumberVector>\n'''
+        return await self.expose(exposure, self.upload_prefix)
 
-        await self.send_xml(xml_path)
-        await asyncio.sleep(0.5)
-        await self.send_xml(xml_exp)
-
-        # Wait for capture
-        await asyncio.sleep(exposure + 5)
-
-        # Find latest fits
-        files = [
-            f
-            for f in os.listdir(".")
-            if f.startswith(upload_prefix) and f.endswith(".fits")
-        ]
-        if not files:
-            return None
-        return sorted(files)[-1]
-
-    def solve_image(self, filepath):
+    async def solve_image(self, filepath):
         print(f"Solving {filepath} with ASTAP...")
+        # The capture name repeats per target; never read a stale sidecar
+        wcs = wcs_path(filepath)
+        try:
+            os.remove(wcs)
+        except FileNotFoundError:
+            pass
         try:
-            # -solve: standard solve
-            res = subprocess.run(
-                ["astap", "-f", filepath, "-solve"], capture_output=True, text=True
+            # -solve: standard solve; run without blocking the event loop
+            proc = await asyncio.create_subprocess_exec(
+                "astap",
+                "-f",
+                filepath,
+                "-solve",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            # ASTAP output: "Solution found: RA=..., Dec=..."
-            if "Solution found" in res.stdout:
-                match = re.search(r"Solution found: ([\d:]+), ([\d\-:]+)", res.stdout)
-                if match:
-                    ra_str, dec_str = match.groups()
-                    return self.hms_to_float(ra_str), self.dms_to_float(dec_str)
-            return None, None
+            out = (await proc.communicate())[0].decode(errors="replace")
+            # Prefer the full-precision header over the rounded stdout text
+            return parse_wcs(wcs) or parse_solution(out) or (None, None)
         except Exception as e:
             print(f"ASTAP failed: {e}")
             return None, None
 
-    def hms_to_float(self, hms):
-        h, m, s = map(float, hms.split(":"))
-        return h + m / 60.0 + s / 3600.0
-
-    def dms_to_float(self, dms):
-        parts = dms.split(":")
-        d = float(parts[0])
-        m = float(parts[1]) if len(parts) > 1 else 0
-        s = float(parts[2]) if len(parts) > 2 else 0
-        sign = 1 if d >= 0 else -1
-        return d + sign * (m / 60.0 + s / 3600.0)
-
     async def run_ppt(self):
         if not await self.connect():
             return
 
         print("\n--- Photography & Pointing Test (PPT) ---")
+        await self.set_upload(self.upload_prefix)
         targets = self.config.get("targets", [(2.0, 45.0), (10.0, 30.0), (18.0, 60.0)])
         exposure = self.config.get("exposure", 2.0)
 
@@ -182,13 +131,11 @@ class PPTAccuracy:
                 print("Capture failed.")
                 continue
 
-            s_ra, s_dec = self.solve_image(filepath)
+            s_ra, s_dec = await self.solve_image(filepath)
             if s_ra is not None and s_dec is not None:
+                ra_diff = (ra - s_ra + 12.0) % 24.0 - 12.0
                 error = (
-                    math.sqrt(
-                        ((ra - s_ra) * 15 * math.cos(math.radians(dec))) ** 2
-                        + (dec - s_dec) ** 2
-                    )
+                    math.hypot(ra_diff * 15 * math.cos(math.radians(dec)), dec - s_dec)
                     * 3600
                 )
                 print(f"Solved: RA={s_ra:.4f}, Dec={s_dec:.4f}")
@@ -199,15 +146,14 @@ class PPTAccuracy:
 
         print("\n--- PPT Report ---")
         if self.results:
-            avg_err = sum(r[4] for r in self.results) / len(self.results)
+            errors = np.array([r[4] for r in self.results])
             print(f"Processed {len(self.results)} points.")
-            print(f"Average Pointing Error: {avg_err:.2f} arcsec")
+            print(f"Average Pointing Error: {errors.mean():.2f} arcsec")
+            print(f"RMS Pointing Error: {np.sqrt(np.mean(errors**2)):.2f} arcsec")
         else:
             print("No valid results.")
 
-        if self.writer:
-            self.writer.close()
-            await self.writer.wait_closed()
+        await self.close()
 
 
 if __name__ == "__main__":
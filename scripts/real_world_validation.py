@@ -13,7 +13,6 @@ import asyncio
 import math
 import ephem
 import numpy as np
-import time
 import argparse
 import sys
 from pathlib import Path
@@ -22,12 +21,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from celestron_aux.celestron_indi_driver import CelestronAUXDriver, STEPS_PER_REVOLUTION
-from celestron_aux.celestron_aux_driver import (
-    AUXCommand,
-    AUXCommands,
-    AUXTargets,
-    unpack_int3_steps,
-)
+from sim_truth import get_sky_altaz, steps_to_altaz
 
 
 class RealWorldValidator:
@@ -51,6 +45,8 @@ class RealWorldValidator:
         if not self.driver.communicator or not self.driver.communicator.connected:
             print("Failed to connect to simulator!")
             return False
+        # Only the simulator is on the wire; overlap request round-trips
+        self.driver.communicator.pipeline = True
 
         print("Resetting alignment model...")
         self.driver.align_clear_all.membervalue = "On"
@@ -64,36 +60,16 @@ class RealWorldValidator:
         return True
 
     async def wait_for_idle(self, timeout=120):
-        start = time.time()
-        while time.time() - start < timeout:
-            await self.driver.read_mount_position()
-            if self.driver.slewing_light.membervalue == "Idle":
-                return True
-            await asyncio.sleep(1)
-        return False
+        idle = await self.driver.wait_for_slew_idle(timeout)
+        await self.driver.read_mount_position()
+        return idle
 
     async def get_true_sky_radec(self):
         """Queries the simulator for the absolute TRUTH (actual sky position)."""
         if not self.driver.communicator:
             return None
 
-        # AZM
-        resp = await self.driver.communicator.send_command(
-            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, AUXTargets.AZM)
-        )
-        true_az_steps = unpack_int3_steps(resp.data)
-
-        # ALT
-        resp = await self.driver.communicator.send_command(
-            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, AUXTargets.ALT)
-        )
-        true_alt_steps = unpack_int3_steps(resp.data)
-
-        # Convert steps to degrees
-        true_az_deg = (true_az_steps / 16777216.0) * 360.0
-        true_alt_deg = (true_alt_steps / 16777216.0) * 360.0
-        if true_alt_deg > 180:
-            true_alt_deg -= 360.0
+        true_az_deg, true_alt_deg = await get_sky_altaz(self.driver.communicator)
 
         # Convert Alt/Az truth to RA/Dec truth
         # Note: We use the driver's observer for time/location
@@ -122,11 +98,7 @@ class RealWorldValidator:
         true_ra, true_dec = truth
 
         # Calculate error between Target and Truth in arcsec
-        ra_diff = true_ra - ra
-        if ra_diff > 12.0:
-            ra_diff -= 24.0
-        if ra_diff < -12.0:
-            ra_diff += 24.0
+        ra_diff = (true_ra - ra + 12.0) % 24.0 - 12.0
 
         ra_err = ra_diff * 3600.0 * 15.0 * math.cos(math.radians(dec))
         dec_err = (true_dec - dec) * 3600.0
@@ -144,22 +116,12 @@ class RealWorldValidator:
         # Get the ACTUAL encoders from the simulator at this moment
         # (Assuming the 'user' has centered the star perfectly)
         await self.driver.read_mount_position()
-        raw_az_deg = (self.driver.current_azm_steps / 16777216.0) * 360.0
-        raw_alt_deg = (self.driver.current_alt_steps / 16777216.0) * 360.0
-        if raw_alt_deg > 180:
-            raw_alt_deg -= 360.0
+        raw_az_deg, raw_alt_deg = steps_to_altaz(
+            self.driver.current_azm_steps, self.driver.current_alt_steps
+        )
 
         # Get the TRUE sky position from the simulator (where the mount is REALLY pointing)
-        resp_az = await self.driver.communicator.send_command(
-            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, AUXTargets.AZM)
-        )
-        true_az_deg = (unpack_int3_steps(resp_az.data) / 16777216.0) * 360.0
-        resp_alt = await self.driver.communicator.send_command(
-            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, AUXTargets.ALT)
-        )
-        true_alt_deg = (unpack_int3_steps(resp_alt.data) / 16777216.0) * 360.0
-        if true_alt_deg > 180:
-            true_alt_deg -= 360.0
+        true_az_deg, true_alt_deg = await get_sky_altaz(self.driver.communicator)
 
         # THE CORE TRUTH:
         # These ENCODER positions (raw_az_deg, raw_alt_deg)
@@ -260,11 +222,7 @@ class RealWorldValidator:
         ra_vals = [d[0] for d in tracking_data]
         dec_vals = [d[1] for d in tracking_data]
 
-        ra_diff = ra_vals[-1] - ra_vals[0]
-        if ra_diff > 12.0:
-            ra_diff -= 24.0
-        if ra_diff < -12.0:
-            ra_diff += 24.0
+        ra_diff = (ra_vals[-1] - ra_vals[0] + 12.0) % 24.0 - 12.0
 
         ra_drift = ra_diff * 3600.0 * 15.0 * math.cos(math.radians(target_center_dec))
         dec_drift = (dec_vals[-1] - dec_vals[0]) * 3600.0
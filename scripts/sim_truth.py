@@ -0,0 +1,54 @@
+"""
+Simulator truth queries shared by the alignment validation scripts.
+"""
+
+from celestron_aux.celestron_aux_driver import (
+    AUXCommand,
+    AUXCommands,
+    AUXTargets,
+    DEGREES_PER_STEP,
+    unpack_int3_steps,
+)
+
+
+def steps_to_altaz(azm_steps, alt_steps):
+    """Converts encoder steps to (az, alt) degrees, alt in [-180, 180)."""
+    alt_deg = (alt_steps * DEGREES_PER_STEP + 180.0) % 360.0 - 180.0
+    return azm_steps * DEGREES_PER_STEP, alt_deg
+
+
+async def get_sky_altaz(communicator):
+    """Queries the simulator's true sky position of both axes in one batch."""
+    resp_az, resp_alt = await communicator.send_commands(
+        [
+            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, axis)
+            for axis in (AUXTargets.AZM, AUXTargets.ALT)
+        ]
+    )
+    return steps_to_altaz(
+        unpack_int3_steps(resp_az.data), unpack_int3_steps(resp_alt.data)
+    )
+
+
+async def get_encoder_and_sky_altaz(communicator):
+    """
+    Queries both axes' encoder positions and the simulator's true sky
+    position in one batch, so a sync pairs readings taken together.
+
+    Returns ((enc_az, enc_alt), (sky_az, sky_alt)) in degrees.
+    """
+    axes = (AUXTargets.AZM, AUXTargets.ALT)
+    enc_az, enc_alt, sky_az, sky_alt = await communicator.send_commands(
+        [AUXCommand(AUXCommands.MC_GET_POSITION, AUXTargets.APP, a) for a in axes]
+        + [
+            AUXCommand(AUXCommands.SIM_GET_SKY_POSITION, AUXTargets.APP, a)
+            for a in axes
+        ]
+    )
+    enc = steps_to_altaz(
+        unpack_int3_steps(enc_az.data), unpack_int3_steps(enc_alt.data)
+    )
+    sky = steps_to_altaz(
+        unpack_int3_steps(sky_az.data), unpack_int3_steps(sky_alt.data)
+    )
+    return enc, sky
@@ -10,6 +10,9 @@ from typing import List, Tuple, Dict, Any, Optional, Union
 import numpy as np
 from scipy.optimize import least_squares
 
+_HOURS_TO_RAD = math.pi / 12.0
+_RAD_TO_HOURS = 12.0 / math.pi
+
 
 def angular_distance(az1: float, alt1: float, az2: float, alt2: float) -> float:
     """Calculates angular distance between two points in degrees."""
@@ -25,7 +28,7 @@ def angular_distance(az1: float, alt1: float, az2: float, alt2: float) -> float:
 
 def vector_from_radec(ra_hours: float, dec_deg: float) -> List[float]:
     """Converts RA/Dec to a 3D unit vector."""
-    ra_rad = math.radians(ra_hours * 15.0)
+    ra_rad = ra_hours * _HOURS_TO_RAD
     dec_rad = math.radians(dec_deg)
     return [
         math.cos(dec_rad) * math.cos(ra_rad),
@@ -45,27 +48,55 @@ def vector_from_altaz(az_deg: float, alt_deg: float) -> List[float]:
     ]
 
 
+def vector_from_altaz_batch(
+    az_deg: Union[List[float], np.ndarray], alt_deg: Union[List[float], np.ndarray]
+) -> np.ndarray:
+    """Converts arrays of Alt/Az to an (N, 3) array of 3D unit vectors."""
+    az_rad = np.radians(np.asarray(az_deg, dtype=float))
+    alt_rad = np.radians(np.asarray(alt_deg, dtype=float))
+    cos_alt = np.cos(alt_rad)
+    return np.column_stack(
+        (cos_alt * np.cos(az_rad), cos_alt * np.sin(az_rad), np.sin(alt_rad))
+    )
+
+
+def vector_to_altaz_batch(vecs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts an (N, 3) array of vectors to Azimuth and Altitude arrays (degrees)."""
+    vecs = np.asarray(vecs, dtype=float)
+    norm = np.linalg.norm(vecs, axis=1)
+    norm = np.where(norm < 1e-9, 1.0, norm)
+    alt_deg = np.degrees(np.arcsin(np.clip(vecs[:, 2] / norm, -1.0, 1.0)))
+    az_deg = np.degrees(np.arctan2(vecs[:, 1], vecs[:, 0]))
+    return az_deg % 360.0, alt_deg
+
+
 def vector_to_radec(vec: Union[List[float], np.ndarray]) -> Tuple[float, float]:
     """Converts a 3D unit vector to RA (hours) and Dec (degrees)."""
-    norm = math.sqrt(sum(x * x for x in vec))
+    vx, vy, vz = vec
+    norm = math.hypot(vx, vy, vz)
     if norm < 1e-9:
         return 0.0, 0.0
-    vx, vy, vz = [x / norm for x in vec]
+    vx /= norm
+    vy /= norm
+    vz /= norm
 
     dec_rad = math.asin(max(-1.0, min(1.0, vz)))
     ra_rad = math.atan2(vy, vx)
 
     dec_deg = math.degrees(dec_rad)
-    ra_hours = math.degrees(ra_rad) / 15.0
+    ra_hours = ra_rad * _RAD_TO_HOURS
     return ra_hours % 24.0, dec_deg
 
 
 def vector_to_altaz(vec: Union[List[float], np.ndarray]) -> Tuple[float, float]:
     """Converts a 3D unit vector to Azimuth and Altitude (degrees)."""
-    norm = math.sqrt(sum(x * x for x in vec))
+    vx, vy, vz = vec
+    norm = math.hypot(vx, vy, vz)
     if norm < 1e-9:
         return 0.0, 0.0
-    vx, vy, vz = [x / norm for x in vec]
+    vx /= norm
+    vy /= norm
+    vz /= norm
 
     alt_rad = math.asin(max(-1.0, min(1.0, vz)))
     az_rad = math.atan2(vy, vx)
@@ -88,6 +119,10 @@ class AlignmentModel:
         self.matrix: np.ndarray = np.identity(3)
         self.params: np.ndarray = np.zeros(6)  # [roll, pitch, yaw, ID, CH, NP]
         self.rms_error_arcsec = 0.0
+        # Column (SoA) copies of self.points, rebuilt by _compute_model
+        self._sky: np.ndarray = np.empty((0, 3))
+        self._mount: np.ndarray = np.empty((0, 3))
+        self._weights: np.ndarray = np.empty(0)
 
     def add_point(
         self,
@@ -154,10 +189,19 @@ class AlignmentModel:
     def clear(self) -> None:
         """Clears all alignment points and resets to identity."""
         self.points = []
+        self._pack_points()
         self.matrix = np.identity(3)
         self.params = np.zeros(6)
         self.rms_error_arcsec = 0.0
 
+    def _pack_points(self) -> None:
+        """Copies the point list into contiguous (N, 3) sky/mount arrays."""
+        n = len(self.points)
+        self._sky = np.array([p["sky"] for p in self.points], dtype=float)
+        self._mount = np.array([p["mount"] for p in self.points], dtype=float)
+        self._weights = np.array([p["weight"] for p in self.points], dtype=float)
+        self._sky.shape = self._mount.shape = (n, 3)
+
     def _get_rotation_matrix(self, r: float, p: float, y: float) -> np.ndarray:
         """Creates a 3D rotation matrix from Euler angles."""
         # Roll, Pitch, Yaw
@@ -195,8 +239,25 @@ class AlignmentModel:
             az + math.degrees(az_corr_rad), alt + math.degrees(alt_corr_rad)
         )
 
+    def _transform_internal_batch(
+        self, sky_vecs: np.ndarray, params: np.ndarray
+    ) -> np.ndarray:
+        """Applies the 6-parameter model to an (N, 3) array of sky vectors."""
+        R = self._get_rotation_matrix(params[0], params[1], params[2])
+        az, alt = vector_to_altaz_batch(sky_vecs @ R.T)
+        alt_rad = np.radians(alt)
+
+        cos_alt = np.maximum(0.01, np.cos(alt_rad))
+        az_corr_rad = params[4] / cos_alt + params[5] * np.tan(alt_rad)
+        alt_corr_rad = params[3]
+
+        return vector_from_altaz_batch(
+            az + np.degrees(az_corr_rad), alt + math.degrees(alt_corr_rad)
+        )
+
     def _compute_model(self) -> None:
         """Fits the adaptive geometric model to the collected points."""
+        self._pack_points()
         if len(self.points) == 0:
             self.matrix = np.identity(3)
             self.params = np.zeros(6)
@@ -219,13 +280,9 @@ class AlignmentModel:
             # p might be 4 or 6 elements
             full_p = np.zeros(6)
             full_p[: len(p)] = p
-            res = []
-            for pt in self.points:
-                m_pred = self._transform_internal(pt["sky"], full_p)
-                dot = np.dot(m_pred, pt["mount"])
-                dot = np.clip(dot, -1.0, 1.0)
-                res.append(math.acos(dot) * pt["weight"])
-            return np.array(res)
+            m_pred = self._transform_internal_batch(self._sky, full_p)
+            dots = np.einsum("ij,ij->i", m_pred, self._mount)
+            return np.arccos(np.clip(dots, -1.0, 1.0)) * self._weights
 
         # Initial guess from SVD matrix
         sy = math.sqrt(
@@ -267,8 +324,8 @@ class AlignmentModel:
             return
 
         if len(self.points) == 1:
-            s = self.points[0]["sky"]
-            m = self.points[0]["mount"]
+            s = self._sky[0]
+            m = self._mount[0]
             v = np.cross(s, m)
             sine = np.linalg.norm(v)
             cosine = np.dot(s, m)
@@ -279,10 +336,9 @@ class AlignmentModel:
                 K = np.array([[0, -v[2], v[1]], [v[2], 0, -v[0]], [-v[1], v[0], 0]])
                 self.matrix = np.identity(3) + sine * K + (1 - cosine) * (K @ K)
         else:
-            S = np.array([p["sky"] for p in self.points]).T
-            M = np.array([p["mount"] for p in self.points]).T
-            W = np.array([p["weight"] for p in self.points])
-            W = W / np.sum(W)
+            S = self._sky.T
+            M = self._mount.T
+            W = self._weights / np.sum(self._weights)
             H = (M * W) @ S.T
             U, _, Vt = np.linalg.svd(H)
             R = U @ Vt
@@ -301,19 +357,14 @@ class AlignmentModel:
             self.rms_error_arcsec = 0.0
             return
 
-        total_sq_error = 0.0
-        for p in self.points:
-            if len(self.points) < 3:
-                pred_mount = self.matrix @ p["sky"]
-            else:
-                pred_mount = self._transform_internal(p["sky"], self.params)
-
-            dot = np.dot(pred_mount, p["mount"])
-            dot = max(-1.0, min(1.0, dot))
-            angle_rad = math.acos(dot)
-            total_sq_error += angle_rad**2
+        if len(self.points) < 3:
+            pred_mount = self._sky @ self.matrix.T
+        else:
+            pred_mount = self._transform_internal_batch(self._sky, self.params)
 
-        rms_rad = math.sqrt(total_sq_error / len(self.points))
+        dots = np.einsum("ij,ij->i", pred_mount, self._mount)
+        angles = np.arccos(np.clip(dots, -1.0, 1.0))
+        rms_rad = math.sqrt(float(np.dot(angles, angles)) / len(self.points))
         self.rms_error_arcsec = math.degrees(rms_rad) * 3600.0
 
     def transform_to_mount(
@@ -329,17 +380,36 @@ class AlignmentModel:
                 R = self.get_local_matrix(
                     target_sky_vec=target_vec, local_bias=local_bias
                 )
-            res = R @ np.array(sky_vec)
-            return res.tolist()
+            return (R @ np.asarray(sky_vec, dtype=float)).tolist()
 
-        return self._transform_internal(np.array(sky_vec), self.params)
+        return self._transform_internal(np.asarray(sky_vec, dtype=float), self.params)
+
+    def is_rotation_only(self, local_bias: float = 0.0) -> bool:
+        """True if transform_to_mount reduces to the global rotation matrix."""
+        n = len(self.points)
+        return n < 3 and (local_bias <= 0 or n < 2)
+
+    def transform_to_mount_batch(
+        self, sky_vecs: Union[List[List[float]], np.ndarray], local_bias: float = 0.0
+    ) -> np.ndarray:
+        """
+        Applies transform_to_mount to an (N, 3) array of sky vectors.
+        With local_bias, each vector is weighted towards its own neighbourhood.
+        """
+        sky_vecs = np.asarray(sky_vecs, dtype=float)
+        if len(self.points) >= 3:
+            return self._transform_internal_batch(sky_vecs, self.params)
+        if local_bias > 0 and len(self.points) >= 2:
+            return np.array(
+                [self.get_local_matrix(v, local_bias) @ v for v in sky_vecs]
+            )
+        return sky_vecs @ self.matrix.T
 
     def transform_to_sky(
         self, mount_vec: Union[List[float], np.ndarray]
     ) -> List[float]:
         """Applies inverse transformation."""
-        res = self.matrix.T @ np.array(mount_vec)
-        return res.tolist()
+        return (self.matrix.T @ np.asarray(mount_vec, dtype=float)).tolist()
 
     def get_local_matrix(
         self,
@@ -352,14 +422,12 @@ class AlignmentModel:
 
         target = np.array(target_sky_vec)
         sigma_sq = 0.5
-        S = np.array([p["sky"] for p in self.points]).T
-        M = np.array([p["mount"] for p in self.points]).T
+        S = self._sky.T
+        M = self._mount.T
         dots = target @ S
         dist_sq = 2.0 * (1.0 - dots)
         prox_weights = np.exp(-dist_sq / sigma_sq)
-        W = np.array([p["weight"] for p in self.points]) * (
-            1.0 + 10.0 * local_bias * prox_weights
-        )
+        W = self._weights * (1.0 + 10.0 * local_bias * prox_weights)
         W = W / np.sum(W)
         H = (M * W) @ S.T
         U, _, Vt = np.linalg.svd(H)
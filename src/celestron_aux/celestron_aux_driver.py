@@ -14,12 +14,14 @@ import struct
 import time
 import asyncio
 import logging
-import serial_asyncio
 from enum import Enum
-from typing import Optional, Union, List, Tuple, Any, TYPE_CHECKING
+from typing import Optional, Union, List, Tuple, Any, Callable
 
-if TYPE_CHECKING:
-    from asyncio import StreamReader, StreamWriter
+# Prefer the eager-write fork (no add/remove_writer per packet); same API
+try:
+    import serial_asyncio_fast as serial_asyncio
+except ImportError:
+    import serial_asyncio
 
 
 logger = logging.getLogger(__name__)
@@ -94,6 +96,15 @@ class AUXTargets(Enum):
     LIGHT = 0xBF  # Lighting (Evolution)
 
 
+# Byte value -> enum member maps for packet parsing. Iterating an Enum skips
+# aliases, so duplicated values map to the canonical member like Enum(value).
+_CMD_BY_VAL = {e.value: e for e in AUXCommands}
+_TGT_BY_VAL = {e.value: e for e in AUXTargets}
+
+# START | LEN | SRC | DST | CMD
+_HEADER = struct.Struct(">5B")
+
+
 class AUXCommand:
     """
     Represents a single Celestron AUX bus command packet.
@@ -106,6 +117,8 @@ class AUXCommand:
         length (int): Length of (source + destination + command + data).
     """
 
+    __slots__ = ("command", "source", "destination", "data", "length")
+
     START_BYTE = 0x3B
     MAX_CMD_LEN = 32
 
@@ -129,15 +142,17 @@ class AUXCommand:
         Returns:
             bytes: The complete packet (START | LEN | SRC | DST | CMD | DATA... | CS).
         """
-        buf = bytearray()
-        buf.append(self.START_BYTE)
-        buf.append(self.length)
-        buf.append(self.source.value)
-        buf.append(self.destination.value)
-        buf.append(self.command.value)
-        buf.extend(self.data)
-        buf.append(self._calculate_checksum(buf[1:]))
-        return bytes(buf)
+        buf = (
+            _HEADER.pack(
+                self.START_BYTE,
+                self.length,
+                self.source.value,
+                self.destination.value,
+                self.command.value,
+            )
+            + self.data
+        )
+        return buf + bytes((self._calculate_checksum(buf, 1),))
 
     @classmethod
     def parse_buf(cls, buf: bytes) -> "AUXCommand":
@@ -151,42 +166,57 @@ class AUXCommand:
             AUXCommand: The parsed command object.
 
         Raises:
-            ValueError: If the start byte is invalid or buffer is too short.
+            ValueError: If the start byte is invalid, the buffer is too short
+                or a target/command byte is unknown.
         """
         if not buf or buf[0] != cls.START_BYTE:
             raise ValueError(f"Invalid start byte or empty buffer: {buf.hex()}")
 
         length = buf[1]
-        source = AUXTargets(buf[2])
-        destination = AUXTargets(buf[3])
-        command = AUXCommands(buf[4])
+        try:
+            source = _TGT_BY_VAL[buf[2]]
+            destination = _TGT_BY_VAL[buf[3]]
+            command = _CMD_BY_VAL[buf[4]]
+        except KeyError:
+            # Let the Enum raise its usual ValueError for the unknown byte
+            source = AUXTargets(buf[2])
+            destination = AUXTargets(buf[3])
+            command = AUXCommands(buf[4])
         data = buf[5:-1]
         checksum = buf[-1]
 
-        calculated_checksum = cls._calculate_checksum(buf[1:-1])
+        calculated_checksum = cls._calculate_checksum(buf, 1, len(buf) - 1)
         if calculated_checksum != checksum:
             # We log but continue, as some mounts have flaky checksums
-            logger.error(
-                f"Checksum error: Expected {calculated_checksum:02X}, Got {checksum:02X} for buffer {buf.hex()}"
-            )
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Checksum error: Expected %02X, Got %02X for buffer %s",
+                    calculated_checksum,
+                    checksum,
+                    buf.hex(),
+                )
 
         cmd = cls(command, source, destination, data)
         cmd.length = length
         return cmd
 
     @staticmethod
-    def _calculate_checksum(data: Union[bytes, bytearray]) -> int:
+    def _calculate_checksum(
+        data: Union[bytes, bytearray], start: int = 0, end: Optional[int] = None
+    ) -> int:
         """
         Calculates the AUX checksum (2's complement of sum).
 
         Args:
-            data (bytes/bytearray): Data to checksum.
+            data (bytes/bytearray): Buffer holding the data to checksum.
+            start (int): Index of the first byte to include.
+            end (int): Index past the last byte to include (default: end).
 
         Returns:
             int: 8-bit checksum value.
         """
-        cs = sum(data)
-        return ((~cs) + 1) & 0xFF
+        # memoryview slicing sums the range without copying the packet
+        return -sum(memoryview(data)[start:end]) & 0xFF
 
     def get_data_as_int(self) -> int:
         """
@@ -195,14 +225,9 @@ class AUXCommand:
         Returns:
             int: The integer value of the payload.
         """
-        value = 0
-        if len(self.data) == 3:
-            value = (self.data[0] << 16) | (self.data[1] << 8) | self.data[2]
-        elif len(self.data) == 2:
-            value = (self.data[0] << 8) | self.data[1]
-        elif len(self.data) == 1:
-            value = self.data[0]
-        return value
+        if len(self.data) > 3:
+            return 0
+        return int.from_bytes(self.data, "big")
 
     def set_data_from_int(self, value: int, num_bytes: int) -> None:
         """
@@ -212,14 +237,9 @@ class AUXCommand:
             value (int): The integer value.
             num_bytes (int): Number of bytes to use (1, 2, or 3).
         """
-        if num_bytes == 1:
-            self.data = value.to_bytes(1, "big")
-        elif num_bytes == 2:
-            self.data = value.to_bytes(2, "big")
-        elif num_bytes == 3:
-            self.data = value.to_bytes(3, "big")
-        else:
+        if num_bytes not in (1, 2, 3):
             raise ValueError("num_bytes must be 1, 2, or 3")
+        self.data = value.to_bytes(num_bytes, "big")
         self.length = 3 + len(self.data)
 
     def __repr__(self) -> str:
@@ -238,26 +258,102 @@ def unpack_int3_steps(d: bytes) -> int:
     """
     if len(d) != 3:
         raise ValueError("Input bytes must be 3 bytes long for unpack_int3_steps")
-    return int.from_bytes(d, "big", signed=False)
+    return (d[0] << 16) | (d[1] << 8) | d[2]
 
 
 def pack_int3_steps(val: float) -> bytes:
     """
     Packs a float or integer into 3 big-endian bytes.
     """
-    v = int(round(val))
-    if not 0 <= v < 2**24:
-        v = v % 16777216
-    return v.to_bytes(3, "big", signed=False)
+    # Masking wraps negative and overflowing values like % 2**24
+    return (int(round(val)) & 0xFFFFFF).to_bytes(3, "big")
 
 
 # Constants for encoder calculations
-STEPS_PER_REVOLUTION = 16777216
+STEPS_PER_REVOLUTION = 1 << 24
+STEP_MASK = STEPS_PER_REVOLUTION - 1  # 2**24 - 1: wraps integer steps via &
 STEPS_PER_DEGREE = STEPS_PER_REVOLUTION / 360.0
 STEPS_PER_ARCSEC = STEPS_PER_DEGREE / 3600.0
+# 360 / 2**24 == 45 / 2**21 is exact in binary, so steps -> degrees is a
+# single correctly rounded multiply
 DEGREES_PER_STEP = 360.0 / STEPS_PER_REVOLUTION
 
 
+class AUXFrameProtocol(asyncio.BufferedProtocol):
+    """
+    Splits the incoming AUX byte stream into whole frames.
+
+    Socket transports read straight into a preallocated buffer
+    (`get_buffer`/`buffer_updated`); serial transports, which only support
+    plain protocols, copy each chunk in via `data_received`. Bytes before a
+    start byte are discarded, so the parser resynchronises after noise.
+
+    Args:
+        on_frame (Callable[[bytes], None]): Called with each complete frame.
+    """
+
+    # Longest frame: START | LEN | 255 bytes | CS, twice for a partial tail
+    BUFFER_SIZE = 2 * (255 + 3)
+
+    def __init__(self, on_frame: Callable[[bytes], None]) -> None:
+        self._on_frame = on_frame
+        self._buf = bytearray(self.BUFFER_SIZE)
+        self._view = memoryview(self._buf)
+        self._len = 0
+        self.transport: Optional[asyncio.BaseTransport] = None
+        self.closed: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if exc is not None:
+            logger.error(f"Communicator: Connection lost: {type(exc).__name__}: {exc}")
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._len == len(self._buf):
+            # No frame fits; the buffer can only hold noise
+            self._len = 0
+        return self._view[self._len :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._len += nbytes
+        self._split_frames()
+
+    def data_received(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            chunk = self.get_buffer(len(view))
+            n = min(len(chunk), len(view))
+            chunk[:n] = view[:n]
+            view = view[n:]
+            self.buffer_updated(n)
+
+    def _split_frames(self) -> None:
+        buf = self._buf
+        end = self._len
+        pos = 0
+        while True:
+            # Resynchronise on the start byte, discarding any noise
+            pos = buf.find(AUXCommand.START_BYTE, pos, end)
+            if pos < 0:
+                pos = end
+                break
+            if end - pos < 2:
+                break
+            frame_end = pos + buf[pos + 1] + 3
+            if frame_end > end:
+                break
+            self._on_frame(bytes(self._view[pos:frame_end]))
+            pos = frame_end
+        # Move the partial tail to the front of the buffer
+        self._len = end - pos
+        if pos and self._len:
+            buf[: self._len] = self._view[pos:end]
+
+
 class AUXCommunicator:
     """
     Handles asynchronous communication with the AUX bus.
@@ -269,16 +365,26 @@ class AUXCommunicator:
         port (str): Device path (e.g. /dev/ttyUSB0) or URL (socket://host:port).
         baudrate (int): Communication speed (default 19200).
         timeout (float): Read timeout in seconds.
+        pipeline (bool): Write multi-command batches back-to-back over TCP.
+            Only for endpoints that answer out of band, like the simulator.
     """
 
-    def __init__(self, port: str, baudrate: int = 19200, timeout: float = 1.0) -> None:
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 19200,
+        timeout: float = 1.0,
+        pipeline: bool = False,
+    ) -> None:
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
-        self.reader: Optional["StreamReader"] = None
-        self.writer: Optional["StreamWriter"] = None
+        self.pipeline = pipeline
+        self.transport: Optional[asyncio.Transport] = None
+        self.protocol: Optional[AUXFrameProtocol] = None
         self.connected = False
         self.lock = asyncio.Lock()
+        self._rx_queue: "asyncio.Queue[bytes]" = asyncio.Queue()
 
     async def connect(self) -> bool:
         """
@@ -288,15 +394,23 @@ class AUXCommunicator:
             bool: True if successful, False otherwise.
         """
         try:
+            loop = asyncio.get_running_loop()
+            rx_queue: "asyncio.Queue[bytes]" = asyncio.Queue()
+
+            def factory() -> AUXFrameProtocol:
+                return AUXFrameProtocol(rx_queue.put_nowait)
+
             if self.port.startswith("socket://"):
                 host, port = self.port[9:].split(":")
-                self.reader, self.writer = await asyncio.open_connection(
-                    host, int(port)
+                transport, protocol = await loop.create_connection(
+                    factory, host, int(port)
                 )
             else:
-                self.reader, self.writer = await serial_asyncio.open_serial_connection(
-                    url=self.port, baudrate=self.baudrate
+                transport, protocol = await serial_asyncio.create_serial_connection(
+                    loop, factory, self.port, baudrate=self.baudrate
                 )
+            self.transport, self.protocol = transport, protocol
+            self._rx_queue = rx_queue
             self.connected = True
             logger.info(
                 f"Communicator: Connected to {self.port} at {self.baudrate} baud."
@@ -309,9 +423,9 @@ class AUXCommunicator:
 
     async def disconnect(self) -> None:
         """Closes the connection."""
-        if self.writer and self.connected:
-            self.writer.close()
-            await self.writer.wait_closed()
+        if self.transport and self.protocol and self.connected:
+            self.transport.close()
+            await self.protocol.closed
             self.connected = False
             logger.info(f"Communicator: Disconnected from {self.port}")
 
@@ -328,48 +442,100 @@ class AUXCommunicator:
         Returns:
             AUXCommand: The response packet, or None on failure/timeout.
         """
-        if not self.connected or not self.writer or not self.reader:
+        return await self.send_raw(command.fill_buf())
+
+    async def send_raw(self, tx_buf: bytes) -> Optional[AUXCommand]:
+        """
+        Sends a pre-serialized AUX packet and waits for a response.
+
+        Args:
+            tx_buf (bytes): Complete packet as produced by AUXCommand.fill_buf().
+
+        Returns:
+            AUXCommand: The response packet, or None on failure/timeout.
+        """
+        if not self.connected or not self.transport:
             return None
 
         async with self.lock:
-            tx_buf = command.fill_buf()
+            # Drop late replies to earlier (timed out) requests
+            while not self._rx_queue.empty():
+                self._rx_queue.get_nowait()
             try:
-                self.writer.write(tx_buf)
-                await self.writer.drain()
+                self.transport.write(tx_buf)
 
                 while True:
-                    # 1. Wait for Start Byte
-                    start_byte = await asyncio.wait_for(
-                        self.reader.readexactly(1), timeout=self.timeout
+                    rx_buf = await asyncio.wait_for(
+                        self._rx_queue.get(), timeout=self.timeout
                     )
-                    if start_byte[0] != AUXCommand.START_BYTE:
+                    # Skip Echo (same source, destination and command)
+                    if rx_buf[2:5] == tx_buf[2:5]:
                         continue
+                    return AUXCommand.parse_buf(rx_buf)
+            except Exception as e:
+                logger.error(
+                    f"Communicator: Error in send_command: {type(e).__name__}: {e}"
+                )
+                return None
 
-                    # 2. Read Length
-                    length_byte = await asyncio.wait_for(
-                        self.reader.readexactly(1), timeout=self.timeout
-                    )
-                    response_length = length_byte[0]
+    async def send_commands(
+        self, commands: List[AUXCommand]
+    ) -> List[Optional[AUXCommand]]:
+        """
+        Sends several AUX commands and collects their responses.
 
-                    # 3. Read payload + Checksum
-                    remaining_bytes = await asyncio.wait_for(
-                        self.reader.readexactly(response_length + 1),
-                        timeout=self.timeout,
-                    )
+        Args:
+            commands (List[AUXCommand]): Commands to send.
 
-                    rx_buf = start_byte + length_byte + remaining_bytes
-                    resp = AUXCommand.parse_buf(rx_buf)
+        Returns:
+            List[Optional[AUXCommand]]: Responses in the order of `commands`.
+        """
+        return await self.send_raw_many([c.fill_buf() for c in commands])
 
-                    # 4. Skip Echo
-                    if (
-                        resp.source == command.source
-                        and resp.destination == command.destination
-                        and resp.command == command.command
-                    ):
-                        continue
-                    return resp
+    async def send_raw_many(self, tx_bufs: List[bytes]) -> List[Optional[AUXCommand]]:
+        """
+        Sends several pre-serialized AUX packets and collects their responses.
+
+        The AUX bus is a half-duplex one-wire line, so by default the
+        packets go one at a time. This also holds for WiFi bridges, which
+        forward TCP onto the same bus. With `pipeline` set, TCP packets are
+        written back-to-back instead, and the replies are matched by
+        (source, destination, command).
+
+        Args:
+            tx_bufs (List[bytes]): Complete packets.
+
+        Returns:
+            List[Optional[AUXCommand]]: Responses in the order of `tx_bufs`.
+        """
+        # Expected reply header: DST | SRC | CMD of each request
+        pending = {bytes((b[3], b[2], b[4])): i for i, b in enumerate(tx_bufs)}
+        if (
+            not self.pipeline
+            or not self.port.startswith("socket://")
+            or len(pending) != len(tx_bufs)
+        ):
+            return [await self.send_raw(b) for b in tx_bufs]
+
+        results: List[Optional[AUXCommand]] = [None] * len(tx_bufs)
+        if not self.connected or not self.transport:
+            return results
+
+        async with self.lock:
+            while not self._rx_queue.empty():
+                self._rx_queue.get_nowait()
+            try:
+                self.transport.writelines(tx_bufs)
+
+                while pending:
+                    rx_buf = await asyncio.wait_for(
+                        self._rx_queue.get(), timeout=self.timeout
+                    )
+                    idx = pending.pop(bytes(rx_buf[2:5]), None)
+                    if idx is not None:
+                        results[idx] = AUXCommand.parse_buf(rx_buf)
             except Exception as e:
                 logger.error(
-                    f"Communicator: Error in send_command: {type(e).__name__}: {e}"
+                    f"Communicator: Error in send_commands: {type(e).__name__}: {e}"
                 )
-                return None
+        return results
@@ -10,8 +10,17 @@ Configuration is loaded from config.default.toml and config.toml.
 
 from __future__ import annotations
 import asyncio
-from typing import Optional, List, Tuple, Dict, Any, Union, TYPE_CHECKING
-from decimal import Decimal
+from typing import (
+    Optional,
+    List,
+    Tuple,
+    Dict,
+    Any,
+    Union,
+    Callable,
+    Awaitable,
+    TYPE_CHECKING,
+)
 import indipydriver
 from indipydriver import (
     IPyDriver,
@@ -30,7 +39,9 @@ from datetime import datetime, timezone
 import tomllib
 import logging
 import os
+import functools
 import math
+import struct
 import numpy as np
 import argparse
 
@@ -44,6 +55,13 @@ try:
 except ImportError:
     HAS_SERVER = False
 
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 from .celestron_aux_driver import (
     AUXCommands,
     AUXTargets,
@@ -52,17 +70,34 @@ from .celestron_aux_driver import (
     pack_int3_steps,
     unpack_int3_steps,
     STEPS_PER_REVOLUTION,
+    STEP_MASK,
+    STEPS_PER_DEGREE,
+    DEGREES_PER_STEP,
 )
+from .kernels import diff_steps, hadec_to_altaz, refract_batch, refract_slope
 from .alignment import (
     AlignmentModel,
     vector_from_radec,
     vector_from_altaz,
+    vector_from_altaz_batch,
     vector_to_radec,
     vector_to_altaz,
+    vector_to_altaz_batch,
 )
 
 logger = logging.getLogger(__name__)
 
+# Earth rotation rate relative to the stars (radians of LST per SI second)
+SIDEREAL_RATE_RAD = 2.0 * math.pi / 86164.0905
+
+# Angle unit conversions (precomputed reciprocals)
+HOURS_TO_RAD = math.pi / 12.0
+RAD_TO_HOURS = 12.0 / math.pi
+
+# Guide-rate payload units per step/s. Celestron's documentation gives
+# 1/1024 arcsec/sec = 128/10125 steps/sec, i.e. exactly 10125/128.
+_RATE_STEPS_TO_PAYLOAD = (360.0 * 3600.0 * 1024.0) / STEPS_PER_REVOLUTION
+
 # Load configuration
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -116,6 +151,15 @@ def apply_refraction(alt_deg: float) -> float:
     return alt_deg + ref_arcmin / 60.0
 
 
+def apply_refraction_batch(alt_deg: np.ndarray) -> np.ndarray:
+    """Vectorized apply_refraction for an array of true altitudes."""
+    alt_deg = np.asarray(alt_deg, dtype=float)
+    h = np.maximum(0.0, alt_deg)
+    ref_arcmin = 1.0 / np.tan(np.radians(h + 7.31 / (h + 4.4)))
+    outside = (alt_deg < -2) | (alt_deg > 89.9)
+    return np.where(outside, alt_deg, alt_deg + ref_arcmin / 60.0)
+
+
 def remove_refraction(alt_deg: float) -> float:
     """Subtracts atmospheric refraction from apparent altitude to get true altitude."""
     if alt_deg < -2 or alt_deg > 89.9:
@@ -212,9 +256,6 @@ class CelestronAUXDriver(IPyDriver):
 
         # 3. Setup hardware communicator
         self.communicator: Optional[AUXCommunicator] = None
-        self.observer = ephem.Observer()
-        self.observer.pressure = 1013.25
-        self.observer.temp = 10.0
 
         self.current_azm_steps = 0
         self.current_alt_steps = 0
@@ -226,6 +267,46 @@ class CelestronAUXDriver(IPyDriver):
 
         # 3. ephem Observer for RA/Dec <-> Alt/Az transformations
         self.observer = ephem.Observer()
+        self._last_observer_date: Optional[float] = None
+        self._last_geo: Optional[Tuple[Any, Any, Any]] = None
+        # Sidereal time and latitude terms cached by update_observer()
+        self._lst0: float = 0.0
+        self._sin_lat: float = 0.0
+        self._cos_lat: float = 1.0
+        self._fixed_body = ephem.FixedBody()
+        # Typed copy of ALIGNMENT_PARAMS/LOCAL_BIAS, refreshed on updates
+        self._local_bias = float(self.align_local_bias.membervalue) / 100.0
+
+        # Last guide rate sent per axis by the tracking loop
+        self._last_rate_azm: Optional[Tuple[AUXCommands, int]] = None
+        self._last_rate_alt: Optional[Tuple[AUXCommands, int]] = None
+
+        # Set while SLEWING is Idle, so callers can await the end of a slew
+        self._slew_idle = asyncio.Event()
+        self._slew_idle.set()
+
+        # Coalesced MOUNT_STATUS updates (one send per loop tick)
+        self._status_dirty = asyncio.Event()
+        self._status_flusher: Optional[asyncio.Task] = None
+
+        # Constant poll packets, serialized once
+        self._poll_azm_bytes = bytes(
+            AUXCommand(
+                AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.AZM
+            ).fill_buf()
+        )
+        self._poll_alt_bytes = bytes(
+            AUXCommand(
+                AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.ALT
+            ).fill_buf()
+        )
+        self._slew_done_bytes = {
+            axis: bytes(
+                AUXCommand(AUXCommands.MC_SLEW_DONE, AUXTargets.APP, axis).fill_buf()
+            )
+            for axis in (AUXTargets.AZM, AUXTargets.ALT)
+        }
+        self._rx_handlers = self._build_rx_handlers()
         self.update_observer()
 
     def _init_properties(self) -> None:
@@ -809,96 +890,111 @@ class CelestronAUXDriver(IPyDriver):
 
     def update_observer(
         self, time_offset: float = 0, base_date: Optional[Any] = None
-    ) -> None:
-        """Updates ephem Observer state from INDI location properties."""
-        self.observer.lat = str(self.lat.membervalue)
-        self.observer.lon = str(self.long.membervalue)
-        self.observer.elevation = float(self.elev.membervalue)
+    ) -> float:
+        """
+        Updates ephem Observer state from INDI location properties.
 
-        # IMPORTANT: Use a local base time to avoid cumulative drift
-        self.observer.date = base_date or ephem.now()
-        if time_offset != 0:
-            self.observer.date = ephem.Date(self.observer.date + time_offset / 86400.0)
+        Returns the local apparent sidereal time (radians) at the new date.
+        """
+        # Only re-parse the location when one of the INDI values changed
+        geo = (self.lat.membervalue, self.long.membervalue, self.elev.membervalue)
+        if geo != self._last_geo:
+            self.observer.lat = str(geo[0])
+            self.observer.lon = str(geo[1])
+            self.observer.elevation = float(geo[2])
+            self._last_geo = geo
+            lat_rad = float(self.observer.lat)
+            self._sin_lat = math.sin(lat_rad)
+            self._cos_lat = math.cos(lat_rad)
+            # Longitude feeds LST, so the cached date/LST pair is stale
+            self._last_observer_date = None
+
+        last = self._last_observer_date
+        if time_offset == 0 and base_date is None:
+            # "Now" requests accept an observer set moments ago
+            now = ephem.now()
+            if last is not None and abs(now - last) * 86400.0 < 0.1:
+                return self._lst0
+        else:
+            now = base_date or ephem.now()
+            # IMPORTANT: Use a local base time to avoid cumulative drift
+            if time_offset != 0:
+                now = ephem.Date(now + time_offset / 86400.0)
+            # Explicit dates are reused only on an exact repeat
+            if now == last:
+                return self._lst0
+        self._last_observer_date = now
+        self.observer.date = now
 
         # Ensure we use JNow (Equinox of Date)
         self.observer.epoch = self.observer.date
 
+        self._lst0 = float(self.observer.sidereal_time())
+        return self._lst0
+
+    def _build_rx_handlers(self) -> Dict[str, Callable[[Any], Awaitable[None]]]:
+        """Maps each writable vector name to its rxevent handler."""
+        handlers: Dict[str, Callable[[Any], Awaitable[None]]] = {
+            "CONNECTION": self.handle_connection,
+            "TELESCOPE_SLEW_RATE": self.handle_std_slew_rate,
+            "TELESCOPE_MOTION_NS": self.handle_motion_ns,
+            "TELESCOPE_MOTION_WE": self.handle_motion_we,
+            "TELESCOPE_ABSOLUTE_COORD": self.handle_goto,
+            "TELESCOPE_PARK": self.handle_park,
+            "TELESCOPE_UNPARK": self.handle_unpark,
+            "HOME": self.handle_home,
+            "TELESCOPE_GUIDE_RATE": self.handle_guide_rate,
+            "GEOGRAPHIC_COORD": self._handle_geographic_coord,
+            "EQUATORIAL_EOD_COORD": self.handle_equatorial_goto,
+            "TELESCOPE_TRACK_MODE": self.handle_track_mode,
+            "ALIGNMENT_CONFIG": self.handle_alignment_config,
+            "ALIGNMENT_PARAMS": self._handle_align_params,
+            "TELESCOPE_LIMITS": self.handle_limits,
+            "TELESCOPE_CORDWRAP": self.handle_cordwrap,
+            "TELESCOPE_CORDWRAP_POS": self.handle_cordwrap_pos,
+            "ABS_FOCUS_POSITION": self.handle_focuser,
+            "GPS_REFRESH": self.handle_gps_refresh,
+            "TELESCOPE_ABORT_MOTION": self.handle_abort_motion,
+        }
+        # Settings that are only stored and acknowledged
+        for vector in (
+            self.port_vector,
+            self.baud_vector,
+            self.slew_rate_vector,
+            self.approach_mode_vector,
+            self.approach_offset_vector,
+            self.coord_set_vector,
+            self.target_type_vector,
+            self.planet_select_vector,
+            self.tle_data_vector,
+            self.refraction_vector,
+        ):
+            handlers[vector.name] = functools.partial(self._accept_vector, vector)
+        return handlers
+
     async def rxevent(self, event: Any) -> None:
         """Main event handler for INDI property updates."""
-        if event.vectorname == "CONNECTION":
-            await self.handle_connection(event)
-        elif event.vectorname == "PORT":
-            self.port_vector.update(event)
-            await self.port_vector.send_setVector(state="Ok")
-        elif event.vectorname == "BAUD":
-            self.baud_vector.update(event)
-            await self.baud_vector.send_setVector(state="Ok")
-        elif event.vectorname == "TELESCOPE_SLEW_RATE":
-            await self.handle_std_slew_rate(event)
-        elif event.vectorname == "SLEW_RATE":
-            self.slew_rate_vector.update(event)
-            await self.slew_rate_vector.send_setVector(state="Ok")
-        elif event.vectorname == "TELESCOPE_MOTION_NS":
-            await self.handle_motion_ns(event)
-        elif event.vectorname == "TELESCOPE_MOTION_WE":
-            await self.handle_motion_we(event)
-        elif event.vectorname == "TELESCOPE_ABSOLUTE_COORD":
-            await self.handle_goto(event)
-        elif event.vectorname == "TELESCOPE_PARK":
-            await self.handle_park(event)
-        elif event.vectorname == "TELESCOPE_UNPARK":
-            await self.handle_unpark(event)
-        elif event.vectorname == "HOME":
-            await self.handle_home(event)
-        elif event.vectorname == "TELESCOPE_GUIDE_RATE":
-            await self.handle_guide_rate(event)
-        elif event.vectorname == "GEOGRAPHIC_COORD":
-            self.location_vector.update(event)
-            self.update_observer()
-            await self.write_location_to_mount()
-            await self.location_vector.send_setVector(state="Ok")
-        elif event.vectorname == "EQUATORIAL_EOD_COORD":
-            await self.handle_equatorial_goto(event)
-        elif event.vectorname == "GOTO_APPROACH_MODE":
-            self.approach_mode_vector.update(event)
-            await self.approach_mode_vector.send_setVector(state="Ok")
-        elif event.vectorname == "GOTO_APPROACH_OFFSET":
-            self.approach_offset_vector.update(event)
-            await self.approach_offset_vector.send_setVector(state="Ok")
-        elif event.vectorname == "TELESCOPE_TRACK_MODE":
-            await self.handle_track_mode(event)
-        elif event.vectorname == "TELESCOPE_ON_COORD_SET":
-            self.coord_set_vector.update(event)
-            await self.coord_set_vector.send_setVector(state="Ok")
-        elif event.vectorname == "ALIGNMENT_CONFIG":
-            await self.handle_alignment_config(event)
-        elif event.vectorname == "ALIGNMENT_PARAMS":
-            self.align_params_vector.update(event)
-            await self.align_params_vector.send_setVector(state="Ok")
-        elif event.vectorname == "TELESCOPE_LIMITS":
-            await self.handle_limits(event)
-        elif event.vectorname == "TELESCOPE_CORDWRAP":
-            await self.handle_cordwrap(event)
-        elif event.vectorname == "TELESCOPE_CORDWRAP_POS":
-            await self.handle_cordwrap_pos(event)
-        elif event.vectorname == "ABS_FOCUS_POSITION":
-            await self.handle_focuser(event)
-        elif event.vectorname == "GPS_REFRESH":
-            await self.handle_gps_refresh(event)
-        elif event.vectorname == "TARGET_TYPE":
-            self.target_type_vector.update(event)
-            await self.target_type_vector.send_setVector(state="Ok")
-        elif event.vectorname == "PLANET_SELECT":
-            self.planet_select_vector.update(event)
-            await self.planet_select_vector.send_setVector(state="Ok")
-        elif event.vectorname == "TLE_DATA":
-            self.tle_data_vector.update(event)
-            await self.tle_data_vector.send_setVector(state="Ok")
-        elif event.vectorname == "REFRACTION_CORRECTION":
-            self.refraction_vector.update(event)
-            await self.refraction_vector.send_setVector(state="Ok")
-        elif event.vectorname == "TELESCOPE_ABORT_MOTION":
-            await self.handle_abort_motion(event)
+        handler = self._rx_handlers.get(event.vectorname)
+        if handler is not None:
+            await handler(event)
+
+    async def _accept_vector(self, vector: Any, event: Any) -> None:
+        """Stores a client update and acknowledges it."""
+        vector.update(event)
+        await vector.send_setVector(state="Ok")
+
+    async def _handle_geographic_coord(self, event: Any) -> None:
+        """Applies a new site location to the observer and the mount."""
+        self.location_vector.update(event)
+        self.update_observer()
+        await self.write_location_to_mount()
+        await self.location_vector.send_setVector(state="Ok")
+
+    async def _handle_align_params(self, event: Any) -> None:
+        """Stores alignment parameters and refreshes the typed local bias."""
+        self.align_params_vector.update(event)
+        self._local_bias = float(self.align_local_bias.membervalue) / 100.0
+        await self.align_params_vector.send_setVector(state="Ok")
 
     async def write_location_to_mount(self) -> bool:
         """Writes current Latitude/Longitude to the mount's GPS/RTC."""
@@ -953,8 +1049,7 @@ class CelestronAUXDriver(IPyDriver):
 
             if self.communicator and self.communicator.connected:
                 # Send Rate 0 to both axes
-                await self.slew_by_rate(AUXTargets.AZM, 0, 1)
-                await self.slew_by_rate(AUXTargets.ALT, 0, 1)
+                await self._stop_axes()
 
             # Cancel tracking if active
             if self._tracking_task:
@@ -962,10 +1057,11 @@ class CelestronAUXDriver(IPyDriver):
                 self._tracking_task = None
                 self.tracking_light.membervalue = "Idle"
 
-            self.slewing_light.membervalue = "Idle"
-            await self.mount_status_vector.send_setVector()
+            self._set_slewing(False)
+            self._mark_status_dirty()
 
             self.abort_motion.membervalue = "Off"
+            await self._send_pending_status()
             await self.abort_motion_vector.send_setVector(state="Ok")
 
     async def handle_cordwrap(self, event: Any) -> None:
@@ -1041,12 +1137,9 @@ class CelestronAUXDriver(IPyDriver):
             self.gps_refresh_vector.update(event)
         if self.gps_refresh.membervalue == "On":
             await self.gps_refresh_vector.send_setVector(state="Busy")
-            if await self.update_gps_data():
-                await self.gps_refresh_vector.send_setVector(state="Ok")
-            else:
-                await self.gps_refresh_vector.send_setVector(state="Alert")
+            ok = await self.update_gps_data()
             self.gps_refresh.membervalue = "Off"
-            await self.gps_refresh_vector.send_setVector()
+            await self.gps_refresh_vector.send_setVector(state="Ok" if ok else "Alert")
 
     async def update_gps_data(self) -> bool:
         """Polls GPS module for status and location data."""
@@ -1104,9 +1197,12 @@ class CelestronAUXDriver(IPyDriver):
         """Handles CONNECT/DISCONNECT switches."""
         if event:
             self.connection_vector.update(event)
+        self._reset_rate_cache()
         if self.conn_connect.membervalue == "On":
             self.communicator = AUXCommunicator(
-                self.port_name.membervalue, int(self.baud_rate.membervalue)
+                self.port_name.membervalue,
+                int(self.baud_rate.membervalue),
+                pipeline=bool(drv_cfg.get("pipeline", False)),
             )
             if await self.communicator.connect():
                 await self.connection_vector.send_setVector(state="Ok")
@@ -1146,15 +1242,24 @@ class CelestronAUXDriver(IPyDriver):
         if not self.communicator or not self.communicator.connected:
             return
 
-        # Get Model
-        resp = await self.communicator.send_command(
-            AUXCommand(AUXCommands.MC_GET_MODEL, AUXTargets.APP, AUXTargets.AZM)
+        # Model and the three versions are independent; fetch them together
+        versions = [
+            (AUXTargets.AZM, self.azm_ver),
+            (AUXTargets.ALT, self.alt_ver),
+            (AUXTargets.HC, self.hc_ver),
+        ]
+        resp, *ver_resps = await self.communicator.send_commands(
+            [AUXCommand(AUXCommands.MC_GET_MODEL, AUXTargets.APP, AUXTargets.AZM)]
+            + [
+                AUXCommand(AUXCommands.GET_VER, AUXTargets.APP, target)
+                for target, _ in versions
+            ]
         )
         if resp:
             model_id = resp.get_data_as_int()
-            cap = MOUNT_CAPABILITIES.get(
-                model_id, {"name": f"Unknown (0x{model_id:04X})", "type": "Unknown"}
-            )
+            cap = MOUNT_CAPABILITIES.get(model_id)
+            if cap is None:
+                cap = {"name": f"Unknown (0x{model_id:04X})", "type": "Unknown"}
             self.model.membervalue = cap["name"]
 
             # Auto-configure mount type
@@ -1165,19 +1270,12 @@ class CelestronAUXDriver(IPyDriver):
             elif m_type == "Alt-Az":
                 self.target_type_vector.label = "Alt-Az Mount"
 
-        # Get Versions
-        for target, member in [
-            (AUXTargets.AZM, self.azm_ver),
-            (AUXTargets.ALT, self.alt_ver),
-            (AUXTargets.HC, self.hc_ver),
-        ]:
-            resp = await self.communicator.send_command(
-                AUXCommand(AUXCommands.GET_VER, AUXTargets.APP, target)
-            )
+        # Versions
+        for (_, member), resp in zip(versions, ver_resps):
             if resp and len(resp.data) == 4:
-                member.membervalue = (
-                    f"{resp.data[0]}.{resp.data[1]}.{resp.data[2] * 256 + resp.data[3]}"
-                )
+                # MAJOR | MINOR | BUILD (16-bit big-endian)
+                major, minor, build = struct.unpack(">BBH", resp.data)
+                member.membervalue = f"{major}.{minor}.{build}"
 
         await self.firmware_vector.send_setVector(state="Ok")
 
@@ -1186,20 +1284,18 @@ class CelestronAUXDriver(IPyDriver):
         if not self.communicator or not self.communicator.connected:
             return
 
-        # AZM
-        resp = await self.communicator.send_command(
-            AUXCommand(AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.AZM)
+        r_azm, r_alt = await self.communicator.send_raw_many(
+            [self._poll_azm_bytes, self._poll_alt_bytes]
         )
-        if resp and len(resp.data) == 3:
-            self.current_azm_steps = unpack_int3_steps(resp.data)
+
+        # AZM
+        if r_azm and len(r_azm.data) == 3:
+            self.current_azm_steps = unpack_int3_steps(r_azm.data)
             self.azm_steps.membervalue = self.current_azm_steps
 
         # ALT
-        resp = await self.communicator.send_command(
-            AUXCommand(AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.ALT)
-        )
-        if resp and len(resp.data) == 3:
-            self.current_alt_steps = unpack_int3_steps(resp.data)
+        if r_alt and len(r_alt.data) == 3:
+            self.current_alt_steps = unpack_int3_steps(r_alt.data)
             self.alt_steps.membervalue = self.current_alt_steps
 
         await self.mount_position_vector.send_setVector(state="Ok")
@@ -1262,18 +1358,34 @@ class CelestronAUXDriver(IPyDriver):
             AUXCommands.MC_MOVE_POS if direction == 1 else AUXCommands.MC_MOVE_NEG
         )
         cmd = AUXCommand(cmd_type, AUXTargets.APP, axis, bytes([rate]))
+        self._reset_rate_cache()
         resp = await self.communicator.send_command(cmd)
         if resp:
-            self.slewing_light.membervalue = "Ok" if rate > 0 else "Idle"
-            await self.mount_status_vector.send_setVector()
+            self._set_slewing(rate > 0)
+            self._mark_status_dirty()
+
+    async def _stop_axes(self) -> None:
+        """Stops both motor axes (rate 0) in one pipelined batch."""
+        if not self.communicator or not self.communicator.connected:
+            return
+        self._reset_rate_cache()
+        r_azm, r_alt = await self.communicator.send_commands(
+            [
+                AUXCommand(AUXCommands.MC_MOVE_POS, AUXTargets.APP, axis, b"\x00")
+                for axis in (AUXTargets.AZM, AUXTargets.ALT)
+            ]
+        )
+        if r_azm or r_alt:
+            self._set_slewing(False)
+            self._mark_status_dirty()
 
     async def _wait_for_slew(self, axis: AUXTargets) -> bool:
         """Waits until the specified axis finishes slewing."""
         if not self.communicator or not self.communicator.connected:
             return True
+        tx_buf = self._slew_done_bytes[axis]
         for _ in range(600):  # 120 seconds timeout (0.2s poll)
-            cmd = AUXCommand(AUXCommands.MC_SLEW_DONE, AUXTargets.APP, axis)
-            resp = await self.communicator.send_command(cmd)
+            resp = await self.communicator.send_raw(tx_buf)
             # Response 0xFF means done
             if resp and len(resp.data) >= 1 and resp.data[0] == 0xFF:
                 return True
@@ -1286,10 +1398,11 @@ class CelestronAUXDriver(IPyDriver):
             return False
         cmd_type = AUXCommands.MC_GOTO_FAST if fast else AUXCommands.MC_GOTO_SLOW
         cmd = AUXCommand(cmd_type, AUXTargets.APP, axis, pack_int3_steps(steps))
+        self._reset_rate_cache()
         resp = await self.communicator.send_command(cmd)
         if resp:
-            self.slewing_light.membervalue = "Ok"
-            await self.mount_status_vector.send_setVector()
+            self._set_slewing(True)
+            self._mark_status_dirty()
             return True
         return False
 
@@ -1299,33 +1412,22 @@ class CelestronAUXDriver(IPyDriver):
         """Calculates current tracking rates in steps/second."""
         dt = 30.0
         base_now = base_date or ephem.now()
-        s1_azm, s1_alt = await self.equatorial_to_steps(
-            ra, dec, time_offset=-dt, base_date=base_now
-        )
-        s2_azm, s2_alt = await self.equatorial_to_steps(
-            ra, dec, time_offset=dt, base_date=base_now
-        )
-
-        def diff_steps(s2: float, s1: float) -> float:
-            d = s2 - s1
-            if d > STEPS_PER_REVOLUTION / 2:
-                d -= STEPS_PER_REVOLUTION
-            if d < -STEPS_PER_REVOLUTION / 2:
-                d += STEPS_PER_REVOLUTION
-            return d
+        lst0 = self.update_observer(base_date=base_now)
+        azm, alt = self.equatorial_to_steps_batch([ra, ra], [dec, dec], [-dt, dt], lst0)
 
-        return diff_steps(s2_azm, s1_azm) / (2.0 * dt), diff_steps(s2_alt, s1_alt) / (
-            2.0 * dt
+        return (
+            diff_steps(azm[1], azm[0], STEPS_PER_REVOLUTION) / (2.0 * dt),
+            diff_steps(alt[1], alt[0], STEPS_PER_REVOLUTION) / (2.0 * dt),
         )
 
     def is_move_allowed(self, azm_steps: float, alt_steps: float) -> bool:
         """Checks if the given position (in steps) is within configured limits."""
-        alt_deg = (alt_steps / STEPS_PER_REVOLUTION) * 360.0
+        alt_deg = alt_steps * DEGREES_PER_STEP
         # Normalize Alt to [-180, 180]
         if alt_deg > 180:
             alt_deg -= 360.0
 
-        azm_deg = (azm_steps / STEPS_PER_REVOLUTION) * 360.0
+        azm_deg = azm_steps * DEGREES_PER_STEP
 
         if not (
             float(self.alt_limit_min.membervalue)
@@ -1377,28 +1479,31 @@ class CelestronAUXDriver(IPyDriver):
             azm_sign = 1 if rate_azm >= 0 else -1
             alt_sign = 1 if rate_alt >= 0 else -1
 
-        if approach_mode != "DISABLED":
+        if approach_mode == "DISABLED":
+            s1, s2 = await asyncio.gather(
+                self._do_slew(AUXTargets.AZM, target_azm, fast=True),
+                self._do_slew(AUXTargets.ALT, target_alt, fast=True),
+            )
+        else:
             off_azm = int(self.approach_azm_offset.membervalue)
             off_alt = int(self.approach_alt_offset.membervalue)
-
-            inter_azm = (target_azm - azm_sign * off_azm) % STEPS_PER_REVOLUTION
-            inter_alt = (target_alt - alt_sign * off_alt) % STEPS_PER_REVOLUTION
-
-            await asyncio.gather(
-                self._do_slew(AUXTargets.AZM, inter_azm, fast=True),
-                self._do_slew(AUXTargets.ALT, inter_alt, fast=True),
-            )
-
-            await asyncio.gather(
-                self._wait_for_slew(AUXTargets.AZM), self._wait_for_slew(AUXTargets.ALT)
+            # Each axis runs its own intermediate -> final pipeline
+            s1, s2 = await asyncio.gather(
+                self._approach_axis(AUXTargets.AZM, target_azm, off_azm, azm_sign),
+                self._approach_axis(AUXTargets.ALT, target_alt, off_alt, alt_sign),
             )
 
-        fast_final = approach_mode == "DISABLED"
-        s1 = await self._do_slew(AUXTargets.AZM, target_azm, fast=fast_final)
-        s2 = await self._do_slew(AUXTargets.ALT, target_alt, fast=fast_final)
-
         return s1 and s2
 
+    async def _approach_axis(
+        self, axis: AUXTargets, target: int, offset: int, sign: int
+    ) -> bool:
+        """Slews one axis to the approach point, then slowly onto the target."""
+        inter = (target - sign * offset) & STEP_MASK
+        await self._do_slew(axis, inter, fast=True)
+        await self._wait_for_slew(axis)
+        return await self._do_slew(axis, target, fast=False)
+
     async def handle_goto(self, event: Any) -> None:
         """Handles GoTo command using raw encoder steps."""
         if event is not None:
@@ -1407,6 +1512,8 @@ class CelestronAUXDriver(IPyDriver):
         if self._movement_task:
             self._movement_task.cancel()
 
+        # Not idle from here on, before the task has sent any GOTO
+        self._slew_idle.clear()
         self._movement_task = asyncio.create_task(self._run_raw_goto(event))
 
     async def _run_raw_goto(self, event: Any) -> None:
@@ -1434,8 +1541,11 @@ class CelestronAUXDriver(IPyDriver):
             logger.error(f"Error in raw GoTo: {e}")
             await self.absolute_coord_vector.send_setVector(state="Alert")
         finally:
-            if self._movement_task and not self._movement_task.cancelled():
+            # A superseded task leaves the new task's state alone
+            if self._movement_task is asyncio.current_task():
                 self._movement_task = None
+                self._set_slewing(False)
+                self._mark_status_dirty()
 
     async def slew_to(self, axis: AUXTargets, steps: int, fast: bool = True) -> bool:
         """Sends a position-based GoTo command to a motor axis."""
@@ -1479,14 +1589,14 @@ class CelestronAUXDriver(IPyDriver):
             self.park_vector.update(event)
         if self.park_switch.membervalue == "On":
             await self.park_vector.send_setVector(state="Busy")
-            if await self.goto_position(0, 0, force_approach="DISABLED"):
+            parked = await self.goto_position(0, 0, force_approach="DISABLED")
+            if parked:
                 self.parked_light.membervalue = "Ok"
-                await self.mount_status_vector.send_setVector()
-                await self.park_vector.send_setVector(state="Ok")
-            else:
-                await self.park_vector.send_setVector(state="Alert")
+                self._mark_status_dirty()
+            # Release the switch in the same update that reports the result
             self.park_switch.membervalue = "Off"
-            await self.park_vector.send_setVector()
+            await self._send_pending_status()
+            await self.park_vector.send_setVector(state="Ok" if parked else "Alert")
 
     async def handle_unpark(self, event: Any) -> None:
         """Clears the parked status."""
@@ -1494,8 +1604,9 @@ class CelestronAUXDriver(IPyDriver):
             self.unpark_vector.update(event)
         if self.unpark_switch.membervalue == "On":
             self.parked_light.membervalue = "Idle"
-            await self.mount_status_vector.send_setVector()
+            self._mark_status_dirty()
             self.unpark_switch.membervalue = "Off"
+            await self._send_pending_status()
             await self.unpark_vector.send_setVector(state="Ok")
 
     async def handle_home(self, event: Any) -> None:
@@ -1516,25 +1627,26 @@ class CelestronAUXDriver(IPyDriver):
         # But MC_LEVEL_START is also used for Alt-Az mounts.
         # For now, we GoTo 0,0 as a reliable fallback for all models.
 
-        success = True
+        axes = []
         if target_azm:
-            success &= await self._do_slew(AUXTargets.AZM, 0, fast=True)
+            axes.append(AUXTargets.AZM)
         if target_alt:
-            success &= await self._do_slew(AUXTargets.ALT, 0, fast=True)
+            axes.append(AUXTargets.ALT)
+
+        # Both axes move (and are awaited) concurrently
+        results = await asyncio.gather(
+            *(self._do_slew(axis, 0, fast=True) for axis in axes)
+        )
+        success = all(results)
 
         if success:
-            if target_azm:
-                await self._wait_for_slew(AUXTargets.AZM)
-            if target_alt:
-                await self._wait_for_slew(AUXTargets.ALT)
-            await self.home_vector.send_setVector(state="Ok")
-        else:
-            await self.home_vector.send_setVector(state="Alert")
+            await asyncio.gather(*(self._wait_for_slew(axis) for axis in axes))
 
+        # Release the switches in the same update that reports the result
         self.home_azm.membervalue = "Off"
         self.home_alt.membervalue = "Off"
         self.home_all.membervalue = "Off"
-        await self.home_vector.send_setVector()
+        await self.home_vector.send_setVector(state="Ok" if success else "Alert")
 
     async def handle_equatorial_goto(self, event: Any) -> None:
         """Handles GoTo or Sync command using RA/Dec coordinates."""
@@ -1559,6 +1671,8 @@ class CelestronAUXDriver(IPyDriver):
         if self._movement_task:
             self._movement_task.cancel()
 
+        # Not idle from here on, before the task has sent any GOTO
+        self._slew_idle.clear()
         self._movement_task = asyncio.create_task(
             self._run_equatorial_goto(target_ra, target_dec)
         )
@@ -1571,23 +1685,16 @@ class CelestronAUXDriver(IPyDriver):
 
         # 1. Convert Target RA/Dec to ideal Alt/Az
         self.update_observer()
-        sync_time = self.observer.date
-        body = ephem.FixedBody()
-        body._ra = math.radians(target_ra * 15.0)
-        body._dec = math.radians(target_dec)
-        body._epoch = sync_time
-        body.compute(self.observer)
-
-        ideal_az_deg = math.degrees(float(body.az))
-        ideal_alt_deg = math.degrees(float(body.alt))
+        ideal_az_deg, ideal_alt_deg = self._fixed_altaz(target_ra, target_dec)
 
         # 2. Get current raw Alt/Az from encoders
-        raw_az_deg = (self.current_azm_steps / STEPS_PER_REVOLUTION) * 360.0
-        raw_alt_deg = (self.current_alt_steps / STEPS_PER_REVOLUTION) * 360.0
+        raw_az_deg = self.current_azm_steps * DEGREES_PER_STEP
+        raw_alt_deg = self.current_alt_steps * DEGREES_PER_STEP
 
-        # 3. Add point to alignment model
-        sky_vec = vector_from_altaz(ideal_az_deg, ideal_alt_deg)
-        mount_vec = vector_from_altaz(raw_az_deg, raw_alt_deg)
+        # 3. Add point to alignment model (sky and mount vectors in one pass)
+        sky_vec, mount_vec = vector_from_altaz_batch(
+            [ideal_az_deg, raw_az_deg], [ideal_alt_deg, raw_alt_deg]
+        )
         self._align_model.add_point(sky_vec, mount_vec, weight=1.0)
 
         # Update point count property before sending vectors
@@ -1608,8 +1715,7 @@ class CelestronAUXDriver(IPyDriver):
                 AUXTargets.ALT,
                 pack_int3_steps(self.current_alt_steps),
             )
-            s1 = await self.communicator.send_command(cmd_azm)
-            s2 = await self.communicator.send_command(cmd_alt)
+            s1, s2 = await self.communicator.send_commands([cmd_azm, cmd_alt])
 
             await self.equatorial_vector.send_setVector(
                 state="Ok" if s1 and s2 else "Alert"
@@ -1656,9 +1762,10 @@ class CelestronAUXDriver(IPyDriver):
                     self._tracking_task.cancel()
                 self._tracking_task = asyncio.create_task(self._tracking_loop())
                 self.tracking_light.membervalue = "Ok"
-                self.slewing_light.membervalue = "Idle"
-                await self.mount_status_vector.send_setVector()
+                self._set_slewing(False)
+                self._mark_status_dirty()
 
+            await self._send_pending_status()
             await self.equatorial_vector.send_setVector(state="Ok")
         except asyncio.CancelledError:
             await self.equatorial_vector.send_setVector(state="Idle")
@@ -1666,8 +1773,11 @@ class CelestronAUXDriver(IPyDriver):
             logger.error(f"Error in equatorial GoTo: {e}")
             await self.equatorial_vector.send_setVector(state="Alert")
         finally:
-            if self._movement_task and not self._movement_task.cancelled():
+            # A superseded task leaves the new task's state alone
+            if self._movement_task is asyncio.current_task():
                 self._movement_task = None
+                self._set_slewing(False)
+                self._mark_status_dirty()
 
     async def _get_target_equatorial(
         self, time_offset: float = 0, base_date: Optional[Any] = None
@@ -1713,10 +1823,20 @@ class CelestronAUXDriver(IPyDriver):
 
         if body:
             body.compute(self.observer)
-            return math.degrees(body.ra) / 15.0, math.degrees(body.dec)
+            return float(body.ra) * RAD_TO_HOURS, math.degrees(body.dec)
 
         return float(self.ra.membervalue), float(self.dec.membervalue)
 
+    def _fixed_altaz(self, ra_hours: float, dec_deg: float) -> Tuple[float, float]:
+        """Computes the Alt/Az (degrees) of a fixed RA/Dec at the observer date."""
+        # Reuse one FixedBody instead of constructing a new one per conversion
+        body = self._fixed_body
+        body._ra = ra_hours * HOURS_TO_RAD
+        body._dec = math.radians(dec_deg)
+        body._epoch = self.observer.date
+        body.compute(self.observer)
+        return math.degrees(float(body.az)), math.degrees(float(body.alt))
+
     async def equatorial_to_steps(
         self,
         ra_hours: float,
@@ -1726,15 +1846,7 @@ class CelestronAUXDriver(IPyDriver):
     ) -> Tuple[float, float]:
         """Converts RA/Dec to motor encoder steps."""
         self.update_observer(time_offset=time_offset, base_date=base_date)
-
-        body = ephem.FixedBody()
-        body._ra = math.radians(ra_hours * 15.0)
-        body._dec = math.radians(dec_deg)
-        body._epoch = self.observer.date
-        body.compute(self.observer)
-
-        ideal_az_deg = math.degrees(float(body.az))
-        ideal_alt_deg = math.degrees(float(body.alt))
+        ideal_az_deg, ideal_alt_deg = self._fixed_altaz(ra_hours, dec_deg)
 
         # 2. Refraction (True to Apparent)
         if self.refraction_on.membervalue == "On":
@@ -1742,23 +1854,154 @@ class CelestronAUXDriver(IPyDriver):
 
         # 3. Apply Alignment Transform
         sky_vec = vector_from_altaz(ideal_az_deg, ideal_alt_deg)
-        bias = float(self.align_local_bias.membervalue) / 100.0
         mount_vec = self._align_model.transform_to_mount(
-            sky_vec, target_vec=sky_vec, local_bias=bias
+            sky_vec, target_vec=sky_vec, local_bias=self._local_bias
         )
         real_az_deg, real_alt_deg = vector_to_altaz(mount_vec)
 
-        azm_steps = (real_az_deg / 360.0) * STEPS_PER_REVOLUTION
-        alt_steps = (real_alt_deg / 360.0) * STEPS_PER_REVOLUTION
+        azm_steps = real_az_deg * STEPS_PER_DEGREE
+        alt_steps = real_alt_deg * STEPS_PER_DEGREE
 
         return azm_steps, alt_steps
 
+    def _apparent_shift(self, ra_rad: float, dec_rad: float) -> Tuple[float, float]:
+        """
+        Returns ephem's apparent-minus-mean (dRA, dDec) in radians for a
+        fixed target at the observer date.
+
+        Nutation and aberration move the apparent place by up to ~30",
+        which changes the Alt/Az rates by a few hundredths of a step/s near
+        the zenith. The shift is constant over a rate interval, so one
+        ephem computation serves all samples.
+        """
+        body = self._fixed_body
+        body._ra = ra_rad
+        body._dec = dec_rad
+        body._epoch = self.observer.date
+        body.compute(self.observer)
+        return float(body.ra) - ra_rad, float(body.dec) - dec_rad
+
+    def equatorial_to_steps_batch(
+        self,
+        ra_hours: Union[List[float], np.ndarray],
+        dec_deg: Union[List[float], np.ndarray],
+        offsets: Union[List[float], np.ndarray],
+        lst0: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts RA/Dec samples at time offsets (s) from sidereal time lst0
+        (radians) to motor steps, using a closed-form hour-angle transform.
+
+        Used for tracking-rate estimation. The observer must be at the date
+        of lst0 (as returned by update_observer). ephem's apparent-place
+        shift and refraction are applied so the result follows the GoTo
+        path (see _apparent_shift and refract_batch).
+        """
+        ra = np.asarray(ra_hours, dtype=float) * HOURS_TO_RAD
+        dec = np.radians(np.asarray(dec_deg, dtype=float))
+        d_ra, d_dec = self._apparent_shift(float(ra[0]), float(dec[0]))
+        ha = lst0 + np.asarray(offsets, dtype=float) * SIDEREAL_RATE_RAD
+        ha -= ra + d_ra
+        dec = dec + d_dec
+        ideal_az_deg, ideal_alt_deg = hadec_to_altaz(
+            ha, dec, self._sin_lat, self._cos_lat
+        )
+        pressure = self.observer.pressure
+        if pressure > 0:
+            ideal_alt_deg = refract_batch(
+                ideal_alt_deg, pressure, self.observer.temperature
+            )
+
+        if self.refraction_on.membervalue == "On":
+            ideal_alt_deg = apply_refraction_batch(ideal_alt_deg)
+
+        sky_vecs = vector_from_altaz_batch(ideal_az_deg, ideal_alt_deg)
+        mount_vecs = self._align_model.transform_to_mount_batch(
+            sky_vecs, local_bias=self._local_bias
+        )
+        real_az_deg, real_alt_deg = vector_to_altaz_batch(mount_vecs)
+
+        return real_az_deg * STEPS_PER_DEGREE, real_alt_deg * STEPS_PER_DEGREE
+
+    def sidereal_rates(
+        self, ra_hours: float, dec_deg: float, lst: float
+    ) -> Tuple[float, float]:
+        """
+        Analytic motor rates (steps/s) for a fixed RA/Dec target.
+
+        Differentiates the closed-form hour-angle transform (dH/dt is the
+        sidereal rate) at the apparent place, refracts the altitude and its
+        rate with the same models as equatorial_to_steps_batch, and maps
+        the sky velocity through the alignment rotation. The observer must
+        be at the date of lst. Valid only for a rotation-only alignment
+        model (see AlignmentModel.is_rotation_only).
+        """
+        ra = ra_hours * HOURS_TO_RAD
+        dec = math.radians(dec_deg)
+        d_ra, d_dec = self._apparent_shift(ra, dec)
+        ha = lst - ra - d_ra
+        dec += d_dec
+        sin_ha = math.sin(ha)
+        cos_ha = math.cos(ha)
+        sin_dec = math.sin(dec)
+        cos_dec = math.cos(dec)
+        sin_lat = self._sin_lat
+        cos_lat = self._cos_lat
+
+        # Horizontal (N, E) direction and altitude, with their time derivatives
+        north = sin_dec * cos_lat - cos_ha * sin_lat * cos_dec
+        east = -sin_ha * cos_dec
+        d_north = SIDEREAL_RATE_RAD * sin_ha * sin_lat * cos_dec
+        d_east = -SIDEREAL_RATE_RAD * cos_ha * cos_dec
+        d_up = -SIDEREAL_RATE_RAD * cos_lat * cos_dec * sin_ha
+        rho = max(math.hypot(north, east), 1e-12)
+        u = np.array([north, east]) / rho
+        d_xy = np.array([d_north, d_east])
+        d_u = (d_xy - u * (u @ d_xy)) / rho
+        alt = math.asin(sin_lat * sin_dec + cos_lat * cos_dec * cos_ha)
+        d_alt = d_up / rho
+
+        # Refraction lifts the altitude and scales its rate by the slope
+        pressure = self.observer.pressure
+        if pressure > 0:
+            alt_deg = float(
+                refract_batch(
+                    np.array([math.degrees(alt)]), pressure, self.observer.temperature
+                )[0]
+            )
+            d_alt *= refract_slope(alt_deg, pressure, self.observer.temperature)
+            alt = math.radians(alt_deg)
+        if self.refraction_on.membervalue == "On":
+            alt_deg = math.degrees(alt)
+            h = 1e-4
+            slope = (apply_refraction(alt_deg + h) - apply_refraction(alt_deg - h)) / (
+                2.0 * h
+            )
+            alt = math.radians(apply_refraction(alt_deg))
+            d_alt *= slope
+
+        # Horizon-frame unit vector (N, E, Up) and its time derivative
+        sin_alt = math.sin(alt)
+        cos_alt = math.cos(alt)
+        sky = np.append(cos_alt * u, sin_alt)
+        d_sky = np.append(cos_alt * d_u - sin_alt * d_alt * u, cos_alt * d_alt)
+
+        R = self._align_model.matrix
+        mx, my, _ = R @ sky
+        dmx, dmy, dmz = R @ d_sky
+        rho2 = max(mx * mx + my * my, 1e-12)
+
+        steps_per_rad = STEPS_PER_REVOLUTION / (2.0 * math.pi)
+        rate_az = (mx * dmy - my * dmx) / rho2
+        rate_alt = dmz / math.sqrt(rho2)
+        return rate_az * steps_per_rad, rate_alt * steps_per_rad
+
     async def steps_to_equatorial(
         self, azm_steps: float, alt_steps: float, base_date: Optional[Any] = None
     ) -> Tuple[float, float]:
         """Converts motor encoder steps to RA/Dec."""
-        real_az_deg = (azm_steps / STEPS_PER_REVOLUTION) * 360.0
-        real_alt_deg = (alt_steps / STEPS_PER_REVOLUTION) * 360.0
+        real_az_deg = azm_steps * DEGREES_PER_STEP
+        real_alt_deg = alt_steps * DEGREES_PER_STEP
 
         mount_vec = vector_from_altaz(real_az_deg, real_alt_deg)
         sky_vec = self._align_model.transform_to_sky(mount_vec)
@@ -1773,12 +2016,13 @@ class CelestronAUXDriver(IPyDriver):
             math.radians(ideal_az_deg), math.radians(ideal_alt_deg)
         )
 
-        return (ra_rad / (2 * math.pi)) * 24, (dec_rad / (2 * math.pi)) * 360
+        return float(ra_rad) * RAD_TO_HOURS, math.degrees(dec_rad)
 
     async def handle_guide_rate(self, event: Any) -> None:
         """Updates guiding/tracking rates."""
         if event and event.root:
             self.guide_rate_vector.update(event.root)
+        self._reset_rate_cache()
         val_azm = int(self.guide_azm.membervalue)
         val_alt = int(self.guide_alt.membervalue)
 
@@ -1796,15 +2040,15 @@ class CelestronAUXDriver(IPyDriver):
         )
 
         if self.communicator:
-            s1 = await self.communicator.send_command(cmd_azm)
-            s2 = await self.communicator.send_command(cmd_alt)
+            s1, s2 = await self.communicator.send_commands([cmd_azm, cmd_alt])
 
             if s1 and s2 and (val_azm > 0 or val_alt > 0):
                 self.tracking_light.membervalue = "Ok"
             else:
                 self.tracking_light.membervalue = "Idle"
 
-            await self.mount_status_vector.send_setVector()
+            self._mark_status_dirty()
+            await self._send_pending_status()
             await self.guide_rate_vector.send_setVector(
                 state="Ok" if s1 and s2 else "Alert"
             )
@@ -1819,61 +2063,65 @@ class CelestronAUXDriver(IPyDriver):
                 self._tracking_task.cancel()
                 self._tracking_task = None
             if self.communicator and self.communicator.connected:
-                await self.slew_by_rate(AUXTargets.AZM, 0, 1)
-                await self.slew_by_rate(AUXTargets.ALT, 0, 1)
+                await self._stop_axes()
             self.tracking_light.membervalue = "Idle"
         else:
             if not self._tracking_task:
+                self._reset_rate_cache()
                 self._tracking_task = asyncio.create_task(self._tracking_loop())
             self.tracking_light.membervalue = "Ok"
 
-        await self.mount_status_vector.send_setVector()
+        self._mark_status_dirty()
+        await self._send_pending_status()
         await self.track_mode_vector.send_setVector(state="Ok")
 
     async def _tracking_loop(self) -> None:
         """Background loop for tracking."""
+        loop = asyncio.get_running_loop()
+        period = 1.0
+        next_tick = loop.time()
         try:
             while True:
                 if not self.communicator or not self.communicator.connected:
                     await asyncio.sleep(0.2)
+                    next_tick = loop.time()
                     continue
 
                 dt = 30.0
                 base_now = ephem.now()
 
-                # Get target coordinates at T+dt and T-dt independently
-                # to account for proper motion of planets/moon/satellites
-                ra_plus, dec_plus = await self._get_target_equatorial(
-                    time_offset=dt, base_date=base_now
-                )
-                s_plus_azm, s_plus_alt = await self.equatorial_to_steps(
-                    ra_plus, dec_plus, time_offset=dt, base_date=base_now
-                )
-
-                ra_minus, dec_minus = await self._get_target_equatorial(
-                    time_offset=-dt, base_date=base_now
-                )
-                s_minus_azm, s_minus_alt = await self.equatorial_to_steps(
-                    ra_minus, dec_minus, time_offset=-dt, base_date=base_now
-                )
-
-                def diff_steps(s2: float, s1: float) -> float:
-                    d = s2 - s1
-                    if d > STEPS_PER_REVOLUTION / 2:
-                        d -= STEPS_PER_REVOLUTION
-                    if d < -STEPS_PER_REVOLUTION / 2:
-                        d += STEPS_PER_REVOLUTION
-                    return d
-
-                rate_azm = diff_steps(s_plus_azm, s_minus_azm) / (2.0 * dt)
-                rate_alt = diff_steps(s_plus_alt, s_minus_alt) / (2.0 * dt)
+                if self.target_sidereal.membervalue == "On" and (
+                    self._align_model.is_rotation_only(self._local_bias)
+                ):
+                    # Fixed target under a pure rotation: exact analytic rates
+                    lst0 = self.update_observer(base_date=base_now)
+                    rate_azm, rate_alt = self.sidereal_rates(
+                        self.current_target_ra, self.current_target_dec, lst0
+                    )
+                else:
+                    # Get target coordinates at T+dt and T-dt independently
+                    # to account for proper motion of planets/moon/satellites
+                    ra_plus, dec_plus = await self._get_target_equatorial(
+                        time_offset=dt, base_date=base_now
+                    )
+                    ra_minus, dec_minus = await self._get_target_equatorial(
+                        time_offset=-dt, base_date=base_now
+                    )
+                    lst0 = self.update_observer(base_date=base_now)
+                    # Both samples converted in one batch
+                    azm, alt = self.equatorial_to_steps_batch(
+                        [ra_minus, ra_plus], [dec_minus, dec_plus], [-dt, dt], lst0
+                    )
+                    rate_azm = diff_steps(azm[1], azm[0], STEPS_PER_REVOLUTION) / (
+                        2.0 * dt
+                    )
+                    rate_alt = diff_steps(alt[1], alt[0], STEPS_PER_REVOLUTION) / (
+                        2.0 * dt
+                    )
 
                 # 3. Apply rates
-                # Guide rate conversion factor:
-                # From Celestron's documentation: 1/1024 arcsec/sec = 128/10125 steps/sec
-                factor = Decimal(10125) / Decimal(128)
-                val_azm = int(round(abs(rate_azm) * float(factor)))
-                val_alt = int(round(abs(rate_alt) * float(factor)))
+                val_azm = int(round(abs(rate_azm) * _RATE_STEPS_TO_PAYLOAD))
+                val_alt = int(round(abs(rate_alt) * _RATE_STEPS_TO_PAYLOAD))
 
                 cmd_azm = AUXCommand(
                     AUXCommands.MC_SET_POS_GUIDERATE
@@ -1892,42 +2140,117 @@ class CelestronAUXDriver(IPyDriver):
                     pack_int3_steps(min(val_alt, 0xFFFFFF)),
                 )
 
-                await self.communicator.send_command(cmd_azm)
-                await self.communicator.send_command(cmd_alt)
-
-                await asyncio.sleep(1.0)
+                # Skip sends that would not change the mount's rate
+                if self._rate_changed(self._last_rate_azm, cmd_azm.command, val_azm):
+                    if await self.communicator.send_command(cmd_azm):
+                        self._last_rate_azm = (cmd_azm.command, val_azm)
+                if self._rate_changed(self._last_rate_alt, cmd_alt.command, val_alt):
+                    if await self.communicator.send_command(cmd_alt):
+                        self._last_rate_alt = (cmd_alt.command, val_alt)
+
+                # Fixed-rate schedule on the monotonic loop clock. On overrun,
+                # skip to the next period boundary instead of piling up lag.
+                next_tick += period
+                now = loop.time()
+                if now > next_tick:
+                    next_tick += math.ceil((now - next_tick) / period) * period
+                await asyncio.sleep(next_tick - now)
         except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.error(f"Error in tracking loop: {e}")
 
+    @staticmethod
+    def _rate_changed(
+        last: Optional[Tuple[AUXCommands, int]], cmd_type: AUXCommands, val: int
+    ) -> bool:
+        """Returns True if a guide rate differs from the last one sent."""
+        return last != (cmd_type, val)
+
+    def _reset_rate_cache(self) -> None:
+        """Forces the tracking loop to resend both guide rates."""
+        self._last_rate_azm = None
+        self._last_rate_alt = None
+
+    def _set_slewing(self, slewing: bool) -> None:
+        """Updates the SLEWING light and the matching idle event."""
+        if slewing:
+            self.slewing_light.membervalue = "Ok"
+            self._slew_idle.clear()
+        else:
+            self.slewing_light.membervalue = "Idle"
+            self._slew_idle.set()
+
+    async def wait_for_slew_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for a running GoTo task to finish and the SLEWING light to
+        return to Idle; False on timeout.
+        """
+
+        async def idle() -> None:
+            task = self._movement_task
+            if task is not None:
+                await asyncio.wait([task])
+            await self._slew_idle.wait()
+
+        try:
+            await asyncio.wait_for(idle(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _mark_status_dirty(self) -> None:
+        """Schedules a MOUNT_STATUS update, merged with any already pending."""
+        self._status_dirty.set()
+        if self._status_flusher is None or self._status_flusher.done():
+            self._status_flusher = asyncio.create_task(self._flush_status())
+
+    async def _flush_status(self) -> None:
+        """Sends MOUNT_STATUS once for each batch of dirty marks."""
+        while True:
+            await self._status_dirty.wait()
+            # _send_pending_status() may have sent it while this task woke
+            if not self._status_dirty.is_set():
+                continue
+            self._status_dirty.clear()
+            await self.mount_status_vector.send_setVector()
+
+    async def _send_pending_status(self) -> None:
+        """
+        Sends a pending MOUNT_STATUS update now, ahead of the batch flush.
+
+        Called before an operation reports Ok, so clients reacting to that
+        state already see the status lights it changed (e.g. PARKED).
+        """
+        if self._status_dirty.is_set():
+            self._status_dirty.clear()
+            await self.mount_status_vector.send_setVector()
+
     async def hardware(self) -> None:
         """Periodically poll hardware status."""
         if self.communicator and self.communicator.connected:
-            self.observer.date = ephem.now()
             self.update_observer()
             await self.read_mount_position()
 
-            r_azm = await self.communicator.send_command(
-                AUXCommand(AUXCommands.MC_SLEW_DONE, AUXTargets.APP, AUXTargets.AZM)
-            )
-            r_alt = await self.communicator.send_command(
-                AUXCommand(AUXCommands.MC_SLEW_DONE, AUXTargets.APP, AUXTargets.ALT)
+            r_azm, r_alt = await self.communicator.send_raw_many(
+                [
+                    self._slew_done_bytes[AUXTargets.AZM],
+                    self._slew_done_bytes[AUXTargets.ALT],
+                ]
             )
 
             if r_azm and r_alt:
                 if r_azm.data[0] != 0xFF or r_alt.data[0] != 0xFF:
-                    self.slewing_light.membervalue = "Ok"
+                    self._set_slewing(True)
                 else:
-                    self.slewing_light.membervalue = "Idle"
+                    self._set_slewing(False)
 
                 if not self.is_move_allowed(
                     float(self.current_azm_steps), float(self.current_alt_steps)
                 ):
-                    await self.slew_by_rate(AUXTargets.AZM, 0, 1)
-                    await self.slew_by_rate(AUXTargets.ALT, 0, 1)
+                    await self._stop_axes()
 
-            await self.mount_status_vector.send_setVector()
+            self._mark_status_dirty()
 
     async def handle_location(self, event: Any) -> None:
         """Sets the geographic location in the mount."""
@@ -1956,6 +2279,8 @@ def main() -> None:
     args = parser.parse_args()
 
     driver = CelestronAUXDriver(driver_name=args.name)
+    # Prefer the libuv-based event loop when available
+    run = uvloop.run if HAS_UVLOOP else asyncio.run
 
     if args.server:
         if not HAS_SERVER or "IPyServer" not in globals():
@@ -1964,9 +2289,9 @@ def main() -> None:
             )
             return
         server = globals()["IPyServer"](driver, port=args.port)
-        asyncio.run(server.asyncrun())
+        run(server.asyncrun())
     else:
-        asyncio.run(driver.asyncrun())
+        run(driver.asyncrun())
 
 
 if __name__ == "__main__":
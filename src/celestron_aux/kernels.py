@@ -0,0 +1,159 @@
+"""
+Numeric Kernels
+
+Small, purely numeric helpers used on the driver's tracking hot path.
+When Numba is installed they are JIT-compiled to machine code; otherwise
+they run as plain Python with identical results.
+"""
+
+from typing import Any, Callable, Tuple
+import math
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore[no-redef]
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrap(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return wrap
+
+
+@njit(cache=True)
+def diff_steps(s2: float, s1: float, rev: int) -> float:
+    """
+    Returns the signed encoder difference s2 - s1 wrapped to [-rev/2, rev/2).
+
+    Args:
+        s2 (float): End position in steps.
+        s1 (float): Start position in steps.
+        rev (int): Steps per full revolution.
+
+    Returns:
+        float: Shortest signed distance in steps.
+    """
+    half = rev // 2
+    return (s2 - s1 + half) % rev - half
+
+
+@njit(cache=True, fastmath=True)
+def hadec_to_altaz(
+    ha: np.ndarray, dec: np.ndarray, sin_lat: float, cos_lat: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form hour angle / declination to azimuth / altitude transform.
+
+    Args:
+        ha (np.ndarray): Hour angles in radians.
+        dec (np.ndarray): Declinations in radians.
+        sin_lat (float): Sine of the observer latitude.
+        cos_lat (float): Cosine of the observer latitude.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Azimuth (N through E) and altitude,
+        both in degrees.
+    """
+    sin_dec = np.sin(dec)
+    cos_dec = np.cos(dec)
+    cos_ha = np.cos(ha)
+    alt = np.arcsin(sin_lat * sin_dec + cos_lat * cos_dec * cos_ha)
+    az = np.pi + np.arctan2(
+        np.sin(ha) * cos_dec, cos_ha * sin_lat * cos_dec - sin_dec * cos_lat
+    )
+    return np.degrees(az) % 360.0, np.degrees(alt)
+
+
+# libastro's refract() stops once the inverse is within 0.1 arcsec
+_REFRACT_TOL = math.radians(0.1 / 3600.0)
+
+
+@njit(cache=True)
+def _unrefract(pressure: float, temp: float, aa: float) -> float:
+    """
+    libastro's unrefract(): apparent to true altitude, both in radians.
+
+    Blends its below-14.5 and above-15.5 degree formulas in between.
+    """
+    aadeg = aa * 180.0 / math.pi
+    if aadeg >= 14.5:
+        ta_ge = aa - 7.888888e-5 * pressure / ((273.0 + temp) * math.tan(aa))
+        if aadeg >= 15.5:
+            return ta_ge
+    a = ((2e-5 * aadeg + 1.96e-2) * aadeg + 1.594e-1) * pressure
+    b = (273.0 + temp) * ((8.45e-2 * aadeg + 5.05e-1) * aadeg + 1.0)
+    r = (a / b) * math.pi / 180.0
+    ta_lt = aa if (aa < 0 and r < 0) else aa - r
+    if aadeg < 14.5:
+        return ta_lt
+    return ta_lt + (ta_ge - ta_lt) * (aadeg - 14.5)
+
+
+@njit(cache=True)
+def refract_batch(alt_deg: np.ndarray, pressure: float, temp: float) -> np.ndarray:
+    """
+    True to apparent altitude exactly as ephem computes Body.alt.
+
+    A port of libastro's refract(), which inverts unrefract() by the
+    secant method, so the closed-form transform can match ephem's
+    refraction for the observer's pressure (mbar) and temperature (C).
+
+    Args:
+        alt_deg (np.ndarray): True altitudes in degrees.
+        pressure (float): Observer pressure in mbar (0 disables refraction).
+        temp (float): Observer temperature in degrees Celsius.
+
+    Returns:
+        np.ndarray: Apparent altitudes in degrees.
+    """
+    out = np.empty(alt_deg.shape[0])
+    for i in range(alt_deg.shape[0]):
+        ta = alt_deg[i] * math.pi / 180.0
+        if math.isnan(ta):
+            out[i] = alt_deg[i]
+            continue
+        t = _unrefract(pressure, temp, ta)
+        d = 0.8 * (ta - t)
+        t0 = t
+        a = ta
+        # libastro needs at most 7 steps; the cap only guards a stalled secant
+        for _ in range(50):
+            a += d
+            t = _unrefract(pressure, temp, a)
+            if abs(ta - t) <= _REFRACT_TOL or t0 == t:
+                break
+            d *= -(ta - t) / (t0 - t)
+            t0 = t
+        out[i] = a * 180.0 / math.pi
+    return out
+
+
+@njit(cache=True)
+def refract_slope(app_alt_deg: float, pressure: float, temp: float) -> float:
+    """
+    d(apparent)/d(true) altitude of libastro's refraction at an apparent
+    altitude, for converting true altitude rates to apparent ones.
+
+    refract() inverts unrefract(), so the slope is the reciprocal of the
+    derivative of the closed-form unrefract() (central difference).
+
+    Args:
+        app_alt_deg (float): Apparent altitude in degrees.
+        pressure (float): Observer pressure in mbar.
+        temp (float): Observer temperature in degrees Celsius.
+
+    Returns:
+        float: Dimensionless slope (1.0 without refraction).
+    """
+    aa = app_alt_deg * math.pi / 180.0
+    h = 1e-7
+    d_true = _unrefract(pressure, temp, aa + h) - _unrefract(pressure, temp, aa - h)
+    return 2.0 * h / d_true
@@ -1,10 +1,28 @@
 import asyncio
 import unittest
 import os
+import socket
 import subprocess
 import time
 from typing import Optional
-from celestron_aux.celestron_indi_driver import CelestronAUXDriver
+from celestron_aux.celestron_indi_driver import AUXTargets, CelestronAUXDriver
+
+
+def wait_for_port(port: int, host: str = "localhost", timeout: float = 10.0) -> bool:
+    """
+    Waits until a TCP port accepts connections.
+
+    Returns:
+        bool: True once the port is reachable, False on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.025)
+    return False
 
 
 class CelestronAUXBaseTest(unittest.IsolatedAsyncioTestCase):
@@ -55,7 +73,9 @@ class CelestronAUXBaseTest(unittest.IsolatedAsyncioTestCase):
             preexec_fn=os.setsid if hasattr(os, "setsid") else None,
         )
         # Wait for simulator to initialize
-        time.sleep(3)
+        if not wait_for_port(cls.sim_port):
+            cls.tearDownClass()
+            raise RuntimeError(f"Simulator did not open port {cls.sim_port}")
 
     @classmethod
     def tearDownClass(cls):
@@ -113,6 +133,33 @@ class CelestronAUXBaseTest(unittest.IsolatedAsyncioTestCase):
 
         print("[SETUP] Hardware ready.")
 
+    async def wait_for_idle(self, timeout: float = 120) -> bool:
+        """
+        Waits until both axes report that slewing has finished.
+
+        Uses the driver's own MC_SLEW_DONE polling (0.2 s cadence) for both
+        axes concurrently, so the wait ends shortly after the mount arrives.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            bool: True if mount reached idle, False if timeout.
+        """
+        if not self.driver.communicator:
+            return False
+        try:
+            done = await asyncio.wait_for(
+                asyncio.gather(
+                    self.driver._wait_for_slew(AUXTargets.AZM),
+                    self.driver._wait_for_slew(AUXTargets.ALT),
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            return False
+        return all(done)
+
     async def asyncTearDown(self):
         """
         Disconnects the driver.
@@ -2,29 +2,10 @@ import asyncio
 import math
 import ephem
 from tests.base_test import CelestronAUXBaseTest
-from celestron_aux.celestron_indi_driver import (
-    AUXTargets,
-    AUXCommand,
-    AUXCommands,
-)
+from celestron_aux.celestron_indi_driver import AUXTargets
 
 
 class TestExperimentalMismatches(CelestronAUXBaseTest):
-    async def wait_for_idle(self, timeout=120):
-        if not self.driver.communicator:
-            return False
-        for _ in range(timeout):
-            r_azm = await self.driver.communicator.send_command(
-                AUXCommand(AUXCommands.MC_SLEW_DONE, AUXTargets.APP, AUXTargets.AZM)
-            )
-            r_alt = await self.driver.communicator.send_command(
-                AUXCommand(AUXCommands.MC_SLEW_DONE, AUXTargets.APP, AUXTargets.ALT)
-            )
-            if r_azm and r_alt and r_azm.data[0] == 0xFF and r_alt.data[0] == 0xFF:
-                return True
-            await asyncio.sleep(1)
-        return False
-
     async def test_6_equatorial_goto(self):
         """RA/Dec GoTo transformation and execution (Experimental)."""
         self.driver.lat.membervalue = 50.1822
@@ -4,9 +4,10 @@ import subprocess
 import sys
 import os
 import time
-import socket
 from typing import Optional, List, Dict
 
+from base_test import wait_for_port
+
 # Constants for integration tests
 SIM_AUX_PORT = 2000
 INDI_SERVER_PORT = 7624
@@ -44,13 +45,18 @@ def simulator_process():
 
     proc = subprocess.Popen(
         cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         env=env,
         preexec_fn=os.setsid if hasattr(os, "setsid") else None,
     )
 
-    time.sleep(3)
+    if not wait_for_port(sim_port):
+        if hasattr(os, "killpg"):
+            os.killpg(os.getpgid(proc.pid), 15)
+        else:
+            proc.kill()
+        pytest.fail(f"caux-sim did not open port {sim_port}")
     yield proc
     try:
         if hasattr(os, "killpg"):
@@ -82,13 +88,15 @@ def driver_process(simulator_process):
 
     proc = subprocess.Popen(
         cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         env=env,
         preexec_fn=os.setsid,
     )
 
-    time.sleep(3)  # Give it a bit more time
+    if not wait_for_port(INDI_SERVER_PORT):
+        os.killpg(os.getpgid(proc.pid), 15)
+        pytest.fail(f"INDI driver did not open port {INDI_SERVER_PORT}")
 
     yield proc
 
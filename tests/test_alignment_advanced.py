@@ -1,7 +1,12 @@
 import unittest
 import numpy as np
 import math
-from celestron_aux.alignment import AlignmentModel, vector_from_altaz, vector_to_altaz
+from celestron_aux.alignment import (
+    AlignmentModel,
+    vector_from_altaz,
+    vector_from_altaz_batch,
+    vector_to_altaz,
+)
 
 
 class TestAdvancedAlignment(unittest.TestCase):
@@ -75,6 +80,26 @@ class TestAdvancedAlignment(unittest.TestCase):
         self.assertAlmostEqual(math.degrees(model.params[4]), 1.0, delta=0.1)
         self.assertAlmostEqual(model.rms_error_arcsec, 0.0, delta=10)
 
+        # Batch transform must match the scalar path
+        sky = vector_from_altaz_batch([10.0, 200.0, 300.0], [20.0, 45.0, 80.0])
+        batch = model.transform_to_mount_batch(sky)
+        for v, b in zip(sky, batch):
+            np.testing.assert_allclose(model.transform_to_mount(v), b, atol=1e-12)
+
+    def test_batch_local_bias(self):
+        model = AlignmentModel()
+        self.assertTrue(model.is_rotation_only(local_bias=0.5))
+        model.add_point(vector_from_altaz(0, 30), vector_from_altaz(1, 30))
+        model.add_point(vector_from_altaz(120, 50), vector_from_altaz(121.5, 50))
+        self.assertTrue(model.is_rotation_only())
+        self.assertFalse(model.is_rotation_only(local_bias=0.5))
+
+        sky = vector_from_altaz_batch([30.0, 100.0], [35.0, 45.0])
+        batch = model.transform_to_mount_batch(sky, local_bias=0.5)
+        for v, b in zip(sky, batch):
+            ref = model.transform_to_mount(v, target_vec=v, local_bias=0.5)
+            np.testing.assert_allclose(ref, b, atol=1e-12)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,11 @@
 import math
 import unittest
-from celestron_aux.alignment import AlignmentModel, vector_from_altaz, vector_to_altaz
+from celestron_aux.alignment import (
+    AlignmentModel,
+    vector_from_altaz,
+    vector_from_altaz_batch,
+    vector_to_altaz,
+)
 
 
 class TestAlignment(unittest.TestCase):
@@ -79,6 +84,28 @@ class TestAlignment(unittest.TestCase):
         self.assertAlmostEqual(res_az, 55.0, places=5)
         self.assertAlmostEqual(res_alt, 20.0, places=5)
 
+    def test_batch_vectors(self):
+        """
+        Description:
+            Verifies that the batched Alt/Az conversion matches the scalar one.
+
+        Methodology:
+            Converts several Alt/Az pairs with `vector_from_altaz_batch` and
+            compares each row with `vector_from_altaz`.
+
+        Expected Results:
+            - Every row must equal the corresponding scalar unit vector.
+        """
+        az = [0.0, 45.0, 200.0, 359.0]
+        alt = [0.0, 20.0, -10.0, 89.0]
+        vecs = vector_from_altaz_batch(az, alt)
+
+        self.assertEqual(vecs.shape, (4, 3))
+        for row, a, h in zip(vecs, az, alt):
+            expected = vector_from_altaz(a, h)
+            for got, exp in zip(row, expected):
+                self.assertAlmostEqual(got, exp)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,258 @@
+import asyncio
+import unittest
+from celestron_aux.celestron_aux_driver import (
+    AUXCommand,
+    AUXCommands,
+    AUXCommunicator,
+    AUXFrameProtocol,
+    AUXTargets,
+    pack_int3_steps,
+    unpack_int3_steps,
+)
+
+
+class TestAUXCommand(unittest.TestCase):
+    """
+    Verification of AUX packet serialization and parsing.
+    """
+
+    def test_roundtrip_and_checksum(self):
+        """
+        Description:
+            Verifies packet layout, checksum and parse/serialize symmetry.
+
+        Methodology:
+            Serializes a MC_GOTO_FAST packet with a 3-byte position and
+            parses it back.
+
+        Expected Results:
+            - The packet must match the reference bytes, including the
+              2's complement checksum of LEN..DATA.
+            - Parsing must restore all fields.
+        """
+        cmd = AUXCommand(
+            AUXCommands.MC_GOTO_FAST,
+            AUXTargets.APP,
+            AUXTargets.AZM,
+            pack_int3_steps(12345),
+        )
+        buf = cmd.fill_buf()
+        self.assertEqual(buf, bytes.fromhex("3b062010020030395f"))
+        self.assertEqual(sum(buf[1:]) & 0xFF, 0)
+
+        parsed = AUXCommand.parse_buf(buf)
+        self.assertEqual(parsed.command, AUXCommands.MC_GOTO_FAST)
+        self.assertEqual(parsed.source, AUXTargets.APP)
+        self.assertEqual(parsed.destination, AUXTargets.AZM)
+        self.assertEqual(unpack_int3_steps(parsed.data), 12345)
+        self.assertEqual(parsed.length, 6)
+
+    def test_parse_unknown_command(self):
+        """
+        Description:
+            Verifies the error raised for an unknown command byte.
+
+        Methodology:
+            Parses a packet whose command byte is not an AUXCommands value.
+
+        Expected Results:
+            - parse_buf must raise ValueError.
+        """
+        buf = bytearray.fromhex("3b03201000")
+        buf[4] = next(v for v in range(256) if v not in {c.value for c in AUXCommands})
+        buf.append(-sum(buf[1:]) & 0xFF)
+        with self.assertRaises(ValueError):
+            AUXCommand.parse_buf(bytes(buf))
+
+
+class TestAUXFrameProtocol(unittest.IsolatedAsyncioTestCase):
+    """
+    Verification of the AUX stream framing protocol.
+    """
+
+    async def test_split_chunked_stream(self):
+        """
+        Description:
+            Verifies that frames are reassembled from arbitrary chunks.
+
+        Methodology:
+            Feeds two packets surrounded by noise through `data_received`
+            one byte at a time, then all at once.
+
+        Expected Results:
+            - Both packets must be delivered intact and in order, and the
+              noise must be discarded.
+        """
+        pkt1 = AUXCommand(
+            AUXCommands.MC_GET_POSITION, AUXTargets.AZM, AUXTargets.APP, b"\x01\x02\x03"
+        ).fill_buf()
+        pkt2 = AUXCommand(
+            AUXCommands.MC_SLEW_DONE, AUXTargets.ALT, AUXTargets.APP, b"\xff"
+        ).fill_buf()
+        stream = b"\x00\x11" + pkt1 + b"\xff" + pkt2
+        for chunks in ([stream[i : i + 1] for i in range(len(stream))], [stream]):
+            frames = []
+            proto = AUXFrameProtocol(frames.append)
+            for chunk in chunks:
+                proto.data_received(chunk)
+            self.assertEqual(frames, [pkt1, pkt2])
+
+
+class TestAUXCommunicator(unittest.IsolatedAsyncioTestCase):
+    """
+    Verification of the AUX communicator against a minimal in-process bus.
+    """
+
+    async def asyncSetUp(self):
+        self.position = 123456
+        self.noise = b""
+        self.server = await asyncio.start_server(self._handle_client, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.comm = AUXCommunicator(f"socket://127.0.0.1:{port}", timeout=1.0)
+        self.assertTrue(await self.comm.connect())
+
+    async def asyncTearDown(self):
+        await self.comm.disconnect()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle_client(self, reader, writer):
+        """Echoes each packet (one-wire bus) and answers MC_GET_POSITION."""
+        try:
+            while True:
+                header = await reader.readexactly(2)
+                rest = await reader.readexactly(header[1] + 1)
+                packet = header + rest
+                writer.write(self.noise + packet)
+                cmd = AUXCommand.parse_buf(packet)
+                data = b""
+                if cmd.command == AUXCommands.MC_GET_POSITION:
+                    data = pack_int3_steps(self.position)
+                reply = AUXCommand(cmd.command, cmd.destination, cmd.source, data)
+                writer.write(reply.fill_buf())
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    async def test_send_command_skips_echo(self):
+        """
+        Description:
+            Verifies that the echoed request is skipped and the mount reply
+            is returned.
+
+        Methodology:
+            Sends MC_GET_POSITION to a bus that echoes every packet before
+            replying with a fixed encoder position.
+
+        Expected Results:
+            - The response must come from the motor controller and carry the
+              encoder position.
+        """
+        resp = await self.comm.send_command(
+            AUXCommand(AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.AZM)
+        )
+        self.assertIsNotNone(resp)
+        self.assertEqual(resp.source, AUXTargets.AZM)
+        self.assertEqual(resp.destination, AUXTargets.APP)
+        self.assertEqual(unpack_int3_steps(resp.data), self.position)
+
+    async def test_send_raw(self):
+        """
+        Description:
+            Verifies that pre-serialized packets behave like send_command.
+
+        Methodology:
+            Serializes a MC_GET_POSITION packet once and sends it twice.
+
+        Expected Results:
+            - Both responses must carry the encoder position.
+        """
+        tx_buf = bytes(
+            AUXCommand(
+                AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.ALT
+            ).fill_buf()
+        )
+        for _ in range(2):
+            resp = await self.comm.send_raw(tx_buf)
+            self.assertIsNotNone(resp)
+            self.assertEqual(resp.source, AUXTargets.ALT)
+            self.assertEqual(unpack_int3_steps(resp.data), self.position)
+
+    async def test_resync_after_noise(self):
+        """
+        Description:
+            Verifies that the frame reader resynchronises on the start byte.
+
+        Methodology:
+            Makes the bus emit garbage bytes before every echo.
+
+        Expected Results:
+            - The response must still be parsed correctly.
+        """
+        self.noise = b"\x00\x11\xff"
+        resp = await self.comm.send_command(
+            AUXCommand(AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.AZM)
+        )
+        self.assertIsNotNone(resp)
+        self.assertEqual(unpack_int3_steps(resp.data), self.position)
+
+    async def test_send_commands_sequential_by_default(self):
+        """
+        Description:
+            Verifies that batches go one packet at a time unless pipelining
+            is enabled (the AUX bus is half-duplex, even behind WiFi).
+
+        Methodology:
+            Sends MC_GET_POSITION to AZM and ALT in one `send_commands` call
+            while counting the `send_raw` round trips.
+
+        Expected Results:
+            - Pipelining must be off by default.
+            - Each command must take its own round trip, in request order.
+        """
+        self.assertFalse(self.comm.pipeline)
+        sent = []
+        send_raw = self.comm.send_raw
+
+        async def counting_send_raw(tx_buf):
+            sent.append(tx_buf[3])
+            return await send_raw(tx_buf)
+
+        self.comm.send_raw = counting_send_raw
+        r_azm, r_alt = await self.comm.send_commands(
+            [
+                AUXCommand(AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.AZM),
+                AUXCommand(AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.ALT),
+            ]
+        )
+        self.assertEqual(sent, [AUXTargets.AZM.value, AUXTargets.ALT.value])
+        self.assertEqual(r_azm.source, AUXTargets.AZM)
+        self.assertEqual(r_alt.source, AUXTargets.ALT)
+
+    async def test_send_commands_pipelined(self):
+        """
+        Description:
+            Verifies that paired-axis commands are pipelined and matched
+            when pipelining is enabled.
+
+        Methodology:
+            Enables `pipeline` and sends MC_GET_POSITION to AZM and ALT in
+            one `send_commands` call.
+
+        Expected Results:
+            - Each response must be returned in request order and come from
+              the addressed axis.
+        """
+        self.comm.pipeline = True
+        r_azm, r_alt = await self.comm.send_commands(
+            [
+                AUXCommand(AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.AZM),
+                AUXCommand(AUXCommands.MC_GET_POSITION, AUXTargets.APP, AUXTargets.ALT),
+            ]
+        )
+        self.assertEqual(r_azm.source, AUXTargets.AZM)
+        self.assertEqual(r_alt.source, AUXTargets.ALT)
+        self.assertEqual(unpack_int3_steps(r_alt.data), self.position)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,6 @@ import ephem
 from base_test import CelestronAUXBaseTest
 from celestron_aux.celestron_indi_driver import (
     AUXTargets,
-    AUXCommand,
     AUXCommands,
 )
 
@@ -16,30 +15,6 @@ class TestCelestronAUXFunctional(CelestronAUXBaseTest):
     Functional test suite for the Celestron AUX INDI Driver.
     """
 
-    async def wait_for_idle(self, timeout=120):
-        """
-        Polls hardware until slewing is finished.
-
-        Args:
-            timeout: Maximum seconds to wait.
-
-        Returns:
-            bool: True if mount reached idle, False if timeout.
-        """
-        if not self.driver.communicator:
-            return False
-        for _ in range(timeout):
-            r_azm = await self.driver.communicator.send_command(
-                AUXCommand(AUXCommands.MC_SLEW_DONE, AUXTargets.APP, AUXTargets.AZM)
-            )
-            r_alt = await self.driver.communicator.send_command(
-                AUXCommand(AUXCommands.MC_SLEW_DONE, AUXTargets.APP, AUXTargets.ALT)
-            )
-            if r_azm and r_alt and r_azm.data[0] == 0xFF and r_alt.data[0] == 0xFF:
-                return True
-            await asyncio.sleep(1)
-        return False
-
     async def test_1_firmware_info(self):
         """
         Description:
@@ -267,10 +242,13 @@ class TestCelestronAUXFunctional(CelestronAUXBaseTest):
         self.assertTrue(success, "Approach slew timed out")
 
         self.assertEqual(len(slew_calls), 4)
-        self.assertEqual(slew_calls[0][1], target_azm - 5000)
-        self.assertTrue(slew_calls[0][2])
-        self.assertEqual(slew_calls[2][1], target_azm)
-        self.assertFalse(slew_calls[2][2])
+        # Axes are pipelined independently, so check the per-axis sequence
+        azm_calls = [c for c in slew_calls if c[0] == AUXTargets.AZM]
+        self.assertEqual(len(azm_calls), 2)
+        self.assertEqual(azm_calls[0][1], target_azm - 5000)
+        self.assertTrue(azm_calls[0][2])
+        self.assertEqual(azm_calls[1][1], target_azm)
+        self.assertFalse(azm_calls[1][2])
 
     async def test_8_approach_tracking_direction(self):
         """
@@ -0,0 +1,119 @@
+import math
+import unittest
+import ephem
+import numpy as np
+from celestron_aux.kernels import (
+    diff_steps,
+    hadec_to_altaz,
+    refract_batch,
+    refract_slope,
+)
+
+STEPS = 16777216
+
+
+class TestKernels(unittest.TestCase):
+    """
+    Verification of the numeric helpers used by the tracking loop.
+    """
+
+    def test_diff_steps_wrap(self):
+        """
+        Description:
+            Verifies that encoder differences take the shortest path across
+            the 0/2^24 boundary.
+
+        Methodology:
+            Computes differences for plain, forward-wrapping and
+            backward-wrapping step pairs.
+
+        Expected Results:
+            - Differences must be signed and never exceed half a revolution.
+        """
+        self.assertEqual(diff_steps(1500.0, 1000.0, STEPS), 500.0)
+        self.assertEqual(diff_steps(1000.0, 1500.0, STEPS), -500.0)
+        self.assertEqual(diff_steps(100.0, STEPS - 100.0, STEPS), 200.0)
+        self.assertEqual(diff_steps(STEPS - 100.0, 100.0, STEPS), -200.0)
+
+    def test_hadec_to_altaz(self):
+        """
+        Description:
+            Verifies the closed-form hour angle / declination transform.
+
+        Methodology:
+            Converts a meridian transit and an object on the celestial equator
+            six hours west of the meridian for a latitude of 50 degrees.
+
+        Expected Results:
+            - The transit must be due south at altitude 90 - (lat - dec).
+            - The equatorial object must set due west (Az 270, Alt 0).
+        """
+        lat = math.radians(50.0)
+        az, alt = hadec_to_altaz(
+            np.radians([0.0, 90.0]),
+            np.radians([20.0, 0.0]),
+            math.sin(lat),
+            math.cos(lat),
+        )
+        np.testing.assert_allclose(az, [180.0, 270.0], atol=1e-9)
+        np.testing.assert_allclose(alt, [60.0, 0.0], atol=1e-9)
+
+    def test_refract_batch_matches_ephem(self):
+        """
+        Description:
+            Verifies the libastro refraction port against ephem's Body.alt.
+
+        Methodology:
+            Computes a star's altitude along its diurnal path with pressure 0
+            (true) and with the default 1010 mbar (apparent), then refracts
+            the true altitudes with `refract_batch`.
+
+        Expected Results:
+            - The port must match ephem within 0.05 arcsec (ephem keeps
+              altitudes in single precision), including below 15 degrees.
+        """
+        obs = ephem.Observer()
+        obs.lat, obs.lon = "50", "20"
+        airless = obs.copy()
+        airless.pressure = 0
+        body = ephem.FixedBody()
+        body._ra, body._dec = 0.0, math.radians(10.0)
+        true_alt, app_alt = [], []
+        for hours in np.arange(0.0, 24.0, 0.25):
+            obs.date = airless.date = ephem.Date("2026/10/16") + hours / 24.0
+            body.compute(airless)
+            if body.alt < math.radians(-0.5):
+                continue
+            true_alt.append(math.degrees(body.alt))
+            body.compute(obs)
+            app_alt.append(math.degrees(body.alt))
+        self.assertLess(min(true_alt), 15.0)
+        ported = refract_batch(np.array(true_alt), obs.pressure, obs.temperature)
+        np.testing.assert_allclose(ported, app_alt, atol=0.05 / 3600.0)
+
+    def test_refract_slope(self):
+        """
+        Description:
+            Verifies the refraction slope against a finite difference of
+            `refract_batch`.
+
+        Methodology:
+            Differences `refract_batch` over +/-0.01 degree of true altitude
+            at several altitudes, including across the 15 degree blend.
+
+        Expected Results:
+            - The slope must match to 1e-4, and be 1.0 without pressure.
+        """
+        pressure, temp = 1010.0, 15.0
+        h = 0.01
+        for alt in (2.0, 8.0, 14.9, 15.1, 30.0, 75.0):
+            lo, app, hi = refract_batch(
+                np.array([alt - h, alt, alt + h]), pressure, temp
+            )
+            slope = refract_slope(app, pressure, temp)
+            self.assertAlmostEqual(slope, (hi - lo) / (2.0 * h), delta=1e-4)
+        self.assertAlmostEqual(refract_slope(30.0, 0.0, temp), 1.0, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
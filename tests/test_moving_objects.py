@@ -5,8 +5,8 @@ import ephem
 import os
 import sys
 import subprocess
-import time
 from celestron_aux.celestron_indi_driver import CelestronAUXDriver, AUXTargets
+from base_test import wait_for_port
 
 
 class TestMovingObjects(unittest.IsolatedAsyncioTestCase):
@@ -49,7 +49,9 @@ class TestMovingObjects(unittest.IsolatedAsyncioTestCase):
             stdout=cls.sim_log,
             stderr=cls.sim_log,
         )
-        time.sleep(3)
+        if not wait_for_port(cls.sim_port):
+            cls.tearDownClass()
+            raise RuntimeError(f"Simulator did not open port {cls.sim_port}")
 
     @classmethod
     def tearDownClass(cls):
@@ -184,12 +186,14 @@ class TestMovingObjects(unittest.IsolatedAsyncioTestCase):
             Verifies that Moon tracking rate is different from the sidereal rate.
 
         Methodology:
-            1. Enables sidereal tracking and captures the guide rate commands sent to MC.
-            2. Switches to Moon tracking and captures the new guide rate commands.
-            3. Compares the raw AUX packets.
+            1. Enables sidereal tracking and reads the guide rates the tracking
+               loop has commanded on each axis.
+            2. Switches to Moon tracking and reads the commanded rates again.
+            3. Compares the (direction, payload) pairs.
 
         Expected Results:
-            - The binary packets for sidereal and lunar tracking rates must differ.
+            - Both phases must have commanded a rate on each axis.
+            - The sidereal and lunar tracking rates must differ.
         """
         # 1. Set Sidereal tracking
         for name in self.driver.target_type_vector:
@@ -203,23 +207,8 @@ class TestMovingObjects(unittest.IsolatedAsyncioTestCase):
         await self.driver.handle_track_mode(None)
         await asyncio.sleep(2)
 
-        # Capture sidereal guide rates
-        sent_cmds = []
-        original_send = self.driver.communicator.send_command
-
-        async def mock_send(command):
-            sent_cmds.append(command)
-            return await original_send(command)
-
-        self.driver.communicator.send_command = mock_send
-
-        await asyncio.sleep(2)
-        sidereal_cmds = [
-            c.fill_buf().hex()
-            for c in sent_cmds
-            if c.command.name in ("MC_SET_POS_GUIDERATE", "MC_SET_NEG_GUIDERATE")
-        ]
-        sent_cmds.clear()
+        # Rates are only re-sent on change, so read what is in force
+        sidereal_rates = (self.driver._last_rate_azm, self.driver._last_rate_alt)
 
         # 2. Set Moon tracking
         for name in self.driver.target_type_vector:
@@ -227,13 +216,11 @@ class TestMovingObjects(unittest.IsolatedAsyncioTestCase):
         self.driver.target_type_vector["MOON"] = "On"
 
         await asyncio.sleep(2)
-        moon_cmds = [
-            c.fill_buf().hex()
-            for c in sent_cmds
-            if c.command.name in ("MC_SET_POS_GUIDERATE", "MC_SET_NEG_GUIDERATE")
-        ]
+        moon_rates = (self.driver._last_rate_azm, self.driver._last_rate_alt)
 
-        self.assertNotEqual(sidereal_cmds, moon_cmds)
+        self.assertNotIn(None, sidereal_rates)
+        self.assertNotIn(None, moon_rates)
+        self.assertNotEqual(sidereal_rates, moon_rates)
 
     async def test_satellite_tracking(self):
         """
@@ -4,6 +4,8 @@ import ephem
 import numpy as np
 import os
 from base_test import CelestronAUXBaseTest
+from celestron_aux.celestron_indi_driver import STEPS_PER_REVOLUTION
+from celestron_aux.kernels import diff_steps
 
 
 class TestTrackingAccuracy(CelestronAUXBaseTest):
@@ -132,6 +134,85 @@ class TestTrackingAccuracy(CelestronAUXBaseTest):
         self.assertLess(ra_std, 15.0, f"High RA jitter: {ra_std:.2f} arcsec")
         self.assertLess(dec_std, 15.0, f"High Dec jitter: {dec_std:.2f} arcsec")
 
+    async def test_closed_form_tracking_rates(self):
+        """
+        Description:
+            Verifies the closed-form tracking-rate path against ephem.
+
+        Methodology:
+            1. Computes rates with `get_tracking_rates` (closed-form LST path).
+            2. Computes the same central difference with `equatorial_to_steps`
+               (full ephem pipeline, refraction included) at +/-30 s.
+            3. Repeats for targets placed 5-12 degrees above the horizon,
+               where refraction changes fastest.
+
+        Expected Results:
+            - Both rates must agree to within 0.025 steps/s on each axis
+              (ephem stores Alt/Az in single precision, ~0.1" near 2*pi).
+        """
+        self.driver.align_clear_all.membervalue = "On"
+        await self.driver.handle_alignment_config(None)
+
+        dt = 30.0
+        base_now = ephem.now()
+        self.driver.update_observer(base_date=base_now)
+        targets = [(2.5, 60.0), (18.6, 38.8), (12.0, 10.0)]
+        for az, alt in [(250.0, 7.0), (110.0, 5.0), (200.0, 12.0)]:
+            ra_rad, dec_rad = self.driver.observer.radec_of(
+                math.radians(az), math.radians(alt)
+            )
+            targets.append((float(ra_rad) * 12.0 / math.pi, math.degrees(dec_rad)))
+
+        for ra, dec in targets:
+            fast_azm, fast_alt = await self.driver.get_tracking_rates(
+                ra, dec, base_date=base_now
+            )
+            s1 = await self.driver.equatorial_to_steps(
+                ra, dec, time_offset=-dt, base_date=base_now
+            )
+            s2 = await self.driver.equatorial_to_steps(
+                ra, dec, time_offset=dt, base_date=base_now
+            )
+            ref_azm = diff_steps(s2[0], s1[0], STEPS_PER_REVOLUTION) / (2.0 * dt)
+            ref_alt = diff_steps(s2[1], s1[1], STEPS_PER_REVOLUTION) / (2.0 * dt)
+            self.assertAlmostEqual(fast_azm, ref_azm, delta=0.025)
+            self.assertAlmostEqual(fast_alt, ref_alt, delta=0.025)
+
+    async def test_analytic_sidereal_rates(self):
+        """
+        Description:
+            Verifies the analytic sidereal-rate path against the batched
+            finite difference, including both refraction models.
+
+        Methodology:
+            1. Clears alignment (analytic precondition) and keeps ephem's
+               default observer pressure.
+            2. Places fixed targets from 5 to 70 degrees altitude.
+            3. Compares `sidereal_rates` with `get_tracking_rates` with the
+               driver's refraction Off and On.
+
+        Expected Results:
+            - Both must agree to within 0.05 steps/s on each axis.
+        """
+        self.driver.align_clear_all.membervalue = "On"
+        await self.driver.handle_alignment_config(None)
+
+        base_now = ephem.now()
+        self.driver.update_observer(base_date=base_now)
+        targets = []
+        for az, alt in [(250, 7), (110, 5), (200, 12), (45, 40), (180, 70)]:
+            ra, dec = self.driver.observer.radec_of(math.radians(az), math.radians(alt))
+            targets.append((float(ra) * 12.0 / math.pi, math.degrees(dec)))
+
+        for refraction in ("Off", "On"):
+            self.driver.refraction_on.membervalue = refraction
+            for ra, dec in targets:
+                ref = await self.driver.get_tracking_rates(ra, dec, base_date=base_now)
+                lst0 = self.driver.update_observer(base_date=base_now)
+                rates = self.driver.sidereal_rates(ra, dec, lst0)
+                self.assertAlmostEqual(rates[0], ref[0], delta=0.05)
+                self.assertAlmostEqual(rates[1], ref[1], delta=0.05)
+
 
 if __name__ == "__main__":
     unittest.main()